@@ -7,17 +7,25 @@ import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
 from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
 from homeassistant.const import CONF_SOURCE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall
 
+from .commands import async_setup_scheduler
 from .const import (
     _DOMAIN_SCHEMA,
+    ATTR_RATE,
     CONF_NAME,
     COORDINATOR,
     DOMAIN,
+    HUB,
+    SCHEDULER,
+    SERVICE_SET_SCHEDULER_RATE,
+    TRIGGERS,
     UNDO_UPDATE_LISTENER,
+    ZONE_CONFIGS,
 )
 from .coordinator import ZoneLightingCoordinator
-from .util import initialize_with_config
+from .store import ZoneStore
+from .util import async_get_zone_config, initialize_with_config
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -37,6 +45,10 @@ CONFIG_SCHEMA = vol.Schema(
     extra=vol.ALLOW_EXTRA,
 )
 
+SET_SCHEDULER_RATE_SCHEMA = vol.Schema(
+    {vol.Required(ATTR_RATE): vol.All(vol.Coerce(float), vol.Range(min=1, max=1000))}
+)
+
 
 async def reload_configuration_yaml(event: dict, hass: HomeAssistant):  # noqa: ARG001
     """Reload configuration.yaml."""
@@ -54,6 +66,18 @@ async def async_setup(hass: HomeAssistant, config: dict[str, Any]):
                     data=entry,
                 ),
             )
+
+    async def async_set_scheduler_rate(call: ServiceCall) -> None:
+        """Set the lights commanded per second across all zones."""
+        scheduler = await async_setup_scheduler(hass)
+        await scheduler.async_set_rate(call.data[ATTR_RATE])
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_SCHEDULER_RATE,
+        async_set_scheduler_rate,
+        schema=SET_SCHEDULER_RATE_SCHEMA,
+    )
     return True
 
 
@@ -67,24 +91,39 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
 
     undo_listener = config_entry.add_update_listener(async_update_options)
     data[config_entry.entry_id] = {UNDO_UPDATE_LISTENER: undo_listener}
-    config_data = await initialize_with_config(hass, config_entry)
-    if config_data is None:
+    config = await initialize_with_config(hass, config_entry)
+    if config is None:
         return True
 
-    coordinator = ZoneLightingCoordinator(hass, config_data)
+    await async_setup_scheduler(hass)
+    coordinator = ZoneLightingCoordinator(hass, config)
     data[config_entry.entry_id][COORDINATOR] = coordinator
+    await coordinator.async_load()
 
     # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
     await coordinator.async_config_entry_first_refresh()
 
-    await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
+    # Entities restore their pieces while being added, commit them together
+    with coordinator.async_restore_phase():
+        await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
 
     return True
 
 
 async def async_update_options(hass, config_entry: ConfigEntry):
-    """Update options."""
-    await hass.config_entries.async_reload(config_entry.entry_id)
+    """Apply changed options to the running zone, reloading only if needed."""
+    coordinator = hass.data[DOMAIN][config_entry.entry_id].get(COORDINATOR)
+    config = async_get_zone_config(hass, config_entry)
+    if coordinator is None or coordinator.zone_name != config.name:
+        await hass.config_entries.async_reload(config_entry.entry_id)
+        return
+    coordinator.async_update_config(config)
+
+
+async def async_remove_entry(hass, config_entry: ConfigEntry) -> None:
+    """Remove the stored zone state of a deleted entry."""
+    hass.data.get(DOMAIN, {}).get(ZONE_CONFIGS, {}).pop(config_entry.entry_id, None)
+    await ZoneStore(hass, config_entry.entry_id).async_remove()
 
 
 async def async_unload_entry(hass, config_entry: ConfigEntry) -> bool:
@@ -104,7 +143,7 @@ async def async_unload_entry(hass, config_entry: ConfigEntry) -> bool:
     if unload_ok:
         data.pop(config_entry.entry_id)
 
-    if not data:
+    if not data.keys() - {HUB, SCHEDULER, TRIGGERS, ZONE_CONFIGS}:
         hass.data.pop(DOMAIN)
 
     return unload_ok
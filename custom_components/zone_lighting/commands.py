@@ -0,0 +1,417 @@
+"""Light command queueing for Zone Lighting."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components import light
+from homeassistant.components.light import (
+    ATTR_COLOR_TEMP_KELVIN,
+    ATTR_HS_COLOR,
+    ATTR_RGB_COLOR,
+    ATTR_RGBW_COLOR,
+    ATTR_RGBWW_COLOR,
+    ATTR_WHITE,
+    ATTR_XY_COLOR,
+)
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    ATTR_RATE,
+    DEFAULT_SCHEDULER_RATE,
+    DEFAULT_ZONE_CONCURRENCY,
+    DOMAIN,
+    SCHEDULER,
+)
+from .store import STORAGE_VERSION
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from homeassistant.core import Context, HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+# Only one of these can be sent in a turn_on call
+COLOR_ATTRIBUTES = frozenset(
+    {
+        ATTR_COLOR_TEMP_KELVIN,
+        ATTR_HS_COLOR,
+        ATTR_RGB_COLOR,
+        ATTR_RGBW_COLOR,
+        ATTR_RGBWW_COLOR,
+        ATTR_WHITE,
+        ATTR_XY_COLOR,
+    }
+)
+
+
+def merge_turn_on_data(pending: dict[str, Any], data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Merge a newer turn_on payload into one that hasn't been sent yet.
+
+    Newer values win, attributes only in the pending payload (like transition)
+    are kept, and a newer color replaces any pending color representation.
+    """
+    if COLOR_ATTRIBUTES.intersection(data):
+        pending = {
+            key: value for key, value in pending.items() if key not in COLOR_ATTRIBUTES
+        }
+    return {**pending, **data}
+
+
+class CoalescingCommandQueue:
+    """
+    Send commands one at a time, at most once per interval.
+
+    Commands that arrive while one is in flight are merged into a single
+    pending command, so only the latest values are sent once it completes.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        send: Callable[[dict[str, Any]], Awaitable[None]],
+        min_interval: float,
+    ) -> None:
+        self._hass = hass
+        self._name = name
+        self._send = send
+        self.min_interval = min_interval
+        self._pending: dict[str, Any] | None = None
+        self._waiters: list[asyncio.Future[None]] = []
+        self._sending: list[asyncio.Future[None]] = []
+        self._task: asyncio.Task | None = None
+        self._last_sent = 0.0
+
+    async def async_send(self, data: dict[str, Any]) -> None:
+        """Queue a command and wait until it, or a command merging it, is sent."""
+        if self._pending is None:
+            self._pending = dict(data)
+        else:
+            _LOGGER.debug("%s: coalescing command %s", self._name, data)
+            self._pending = merge_turn_on_data(self._pending, data)
+
+        waiter = self._hass.loop.create_future()
+        self._waiters.append(waiter)
+        if self._task is None or self._task.done():
+            self._task = self._hass.async_create_background_task(
+                self._async_run(), f"{self._name} command queue"
+            )
+        await waiter
+
+    async def _async_run(self) -> None:
+        while self._pending is not None:
+            delay = self._last_sent + self.min_interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            data, self._pending = self._pending, None
+            waiters = self._sending = self._waiters
+            self._waiters = []
+            self._last_sent = time.monotonic()
+            try:
+                await self._send(data)
+            except Exception as err:  # noqa: BLE001
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_exception(err)
+            else:
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_result(None)
+            finally:
+                # A discarded runner must not clear the state of the one after it
+                if self._sending is waiters:
+                    self._sending = []
+
+    @callback
+    def async_discard(self) -> None:
+        """
+        Drop the pending and in-flight commands, as a later command replaces them.
+
+        Their callers return as if the commands were sent.
+        """
+        self._pending = None
+        for waiter in (*self._sending, *self._waiters):
+            if not waiter.done():
+                waiter.set_result(None)
+        self._sending = []
+        self._waiters = []
+        if self._task and not self._task.done():
+            self._task.cancel()
+        # The next command starts a new runner rather than wait on this one
+        self._task = None
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop the pending command and stop sending."""
+        self._pending = None
+        if self._task and not self._task.done():
+            self._task.cancel()
+        for waiter in (*self._sending, *self._waiters):
+            waiter.cancel()
+        self._sending = []
+        self._waiters = []
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> CommandScheduler:
+    """Return the command scheduler shared by all zones, creating it on first use."""
+    data = hass.data.setdefault(DOMAIN, {})
+    if (scheduler := data.get(SCHEDULER)) is None:
+        scheduler = data[SCHEDULER] = CommandScheduler(hass)
+    return scheduler
+
+
+async def async_setup_scheduler(hass: HomeAssistant) -> CommandScheduler:
+    """Return the shared command scheduler once its saved rate is loaded."""
+    scheduler = async_get_scheduler(hass)
+    await scheduler.async_load()
+    return scheduler
+
+
+class ScheduledCall:
+    """A light service call waiting for, or holding, a slot in the scheduler."""
+
+    def __init__(
+        self,
+        priority: int,
+        sequence: int,
+        zone_id: str,
+        service: str,
+        data: dict[str, Any],
+        context: Context | None,
+        timeout: float | None,
+        future: asyncio.Future[bool],
+    ) -> None:
+        self.priority = priority
+        self.sequence = sequence
+        self.zone_id = zone_id
+        self.service = service
+        self.data = data
+        self.context = context
+        self.timeout = timeout
+        self.future = future
+        self.task: asyncio.Task | None = None
+
+        entity_ids = data.get(ATTR_ENTITY_ID, ())
+        self.size = 1 if isinstance(entity_ids, str) else max(1, len(entity_ids))
+
+
+class CommandScheduler:
+    """
+    Rate limit light service calls from all zones.
+
+    Calls take a token per targeted light from a bucket shared by every zone,
+    so together zones never send more than the integration's rate. Each zone
+    only has a limited number of calls in flight, and waiting calls are sent
+    by priority so interactive commands overtake background restores.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{SCHEDULER}"
+        )
+        self._load_task: asyncio.Task | None = None
+        self._concurrency: dict[str, int] = {}
+        self._rate = float(DEFAULT_SCHEDULER_RATE)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._queue: list[ScheduledCall] = []
+        self._running: dict[str, int] = {}
+        self._sequence = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def rate(self) -> float:
+        """Lights commanded per second across all zones."""
+        return self._rate
+
+    @property
+    def burst(self) -> float:
+        """Tokens the bucket holds when full, one second of commands."""
+        return max(1.0, self._rate)
+
+    async def async_load(self) -> None:
+        """Load the saved rate, once however many zones wait for it."""
+        if self._load_task is None:
+            self._load_task = self.hass.async_create_task(
+                self._async_load(), f"{DOMAIN} load command scheduler"
+            )
+        await self._load_task
+
+    async def _async_load(self) -> None:
+        if (data := await self._store.async_load()) is not None:
+            self._async_apply_rate(data[ATTR_RATE])
+
+    async def async_set_rate(self, rate: float) -> None:
+        """Change the rate shared by all zones and save it."""
+        self._async_apply_rate(rate)
+        await self._store.async_save({ATTR_RATE: self._rate})
+
+    @callback
+    def _async_apply_rate(self, rate: float) -> None:
+        self._async_refill()
+        self._rate = float(rate)
+        self._tokens = min(self._tokens, self.burst)
+        if self._queue:
+            self._async_wake()
+
+    @callback
+    def async_set_zone(self, zone_id: str, concurrency: int) -> None:
+        """Register or update a zone's concurrency limit."""
+        self._concurrency[zone_id] = concurrency
+        if self._queue:
+            self._async_wake()
+
+    @callback
+    def async_remove_zone(self, zone_id: str) -> None:
+        """Forget a zone's limit once it's unloaded."""
+        self._concurrency.pop(zone_id, None)
+
+    @callback
+    def _async_refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    async def async_call(
+        self,
+        zone_id: str,
+        service: str,
+        data: dict[str, Any],
+        priority: int = PRIORITY_INTERACTIVE,
+        context: Context | None = None,
+        timeout: float | None = None,
+    ) -> bool:
+        """
+        Call a light service once the scheduler admits it, and wait for it.
+
+        Returns False if the call didn't complete within the timeout once sent,
+        it then finishes in the background without holding the zone's slot.
+        """
+        call = ScheduledCall(
+            priority,
+            next(self._sequence),
+            zone_id,
+            service,
+            data,
+            context,
+            timeout,
+            self.hass.loop.create_future(),
+        )
+        self._queue.append(call)
+        self._async_wake()
+        try:
+            return await call.future
+        except asyncio.CancelledError:
+            if call.task is None:
+                self._queue.remove(call)
+            else:
+                call.task.cancel()
+            raise
+
+    @callback
+    def _async_wake(self) -> None:
+        self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._task = self.hass.async_create_background_task(
+                self._async_run(), f"{DOMAIN} command scheduler"
+            )
+
+    def _async_next_call(self) -> ScheduledCall | None:
+        """Return the most urgent call of a zone below its concurrency limit."""
+        return min(
+            (
+                call
+                for call in self._queue
+                if self._running.get(call.zone_id, 0)
+                < self._concurrency.get(call.zone_id, DEFAULT_ZONE_CONCURRENCY)
+            ),
+            key=lambda call: (call.priority, call.sequence),
+            default=None,
+        )
+
+    async def _async_run(self) -> None:
+        while self._queue:
+            self._wakeup.clear()
+            delay = None
+            if (call := self._async_next_call()) is not None:
+                self._async_refill()
+                # A call larger than the bucket goes out once it's full and
+                # leaves it in debt, which the calls after it wait out
+                needed = min(call.size, self.burst)
+                if self._tokens >= needed:
+                    self._queue.remove(call)
+                    self._tokens -= call.size
+                    self._async_start(call)
+                    continue
+                delay = (needed - self._tokens) / self._rate
+
+            # Wait for tokens, a finished call or a more urgent one
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(delay):
+                    await self._wakeup.wait()
+
+    @callback
+    def _async_start(self, call: ScheduledCall) -> None:
+        self._running[call.zone_id] = self._running.get(call.zone_id, 0) + 1
+        call.task = self.hass.async_create_background_task(
+            self._async_send(call), f"{DOMAIN} {call.zone_id} {call.service}"
+        )
+
+    async def _async_send(self, call: ScheduledCall) -> None:
+        service_call = self.hass.async_create_background_task(
+            self.hass.services.async_call(
+                light.DOMAIN,
+                call.service,
+                call.data,
+                blocking=True,
+                context=call.context,
+            ),
+            f"{DOMAIN} {call.zone_id} {call.service} call",
+        )
+        try:
+            done, _ = await asyncio.wait({service_call}, timeout=call.timeout)
+        except asyncio.CancelledError:
+            service_call.cancel()
+            raise
+        finally:
+            self._running[call.zone_id] -= 1
+            if self._queue:
+                self._async_wake()
+
+        if not done:
+            service_call.add_done_callback(_log_late_call)
+            if not call.future.done():
+                call.future.set_result(False)
+            return
+
+        err = service_call.exception()
+        if call.future.done():
+            return
+        if err is not None:
+            call.future.set_exception(err)
+        else:
+            call.future.set_result(True)
+
+
+def _log_late_call(task: asyncio.Task) -> None:
+    if not task.cancelled() and (err := task.exception()) is not None:
+        _LOGGER.debug("%s failed after its deadline: %s", task.get_name(), err)
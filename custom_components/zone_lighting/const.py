@@ -20,6 +20,9 @@ DOCS[CONF_NAME] = "Display name for this zone"
 CONF_LIGHTS, DEFAULT_LIGHTS = "lights", []
 DOCS[CONF_LIGHTS] = "Light entity ids this zone will control"
 
+CONF_ZONES, DEFAULT_ZONES = "zones", []
+DOCS[CONF_ZONES] = "Child zones whose lights this zone also controls"
+
 CONF_SCENES, DEFAULT_SCENES = "scenes", [""]
 DOCS[CONF_SCENES] = "Simple scenes for this zone, state will be saved in HA scenes"
 
@@ -29,6 +32,35 @@ DOCS[CONF_SCENES_EVENT] = "Scenes that will be handled by automations"
 CONF_CONTROLLERS, DEFAULT_CONTROLLERS = "controllers", [""]
 DOCS[CONF_CONTROLLERS] = "Controllers for this zone"
 
+CONF_BRIGHTNESS_TOLERANCE, DEFAULT_BRIGHTNESS_TOLERANCE = "brightness_tolerance", 2
+DOCS[CONF_BRIGHTNESS_TOLERANCE] = "Brightness difference treated as already restored"
+
+CONF_COLOR_TEMP_TOLERANCE, DEFAULT_COLOR_TEMP_TOLERANCE = "color_temp_tolerance", 50
+DOCS[CONF_COLOR_TEMP_TOLERANCE] = "Kelvin difference treated as already restored"
+
+CONF_XY_TOLERANCE, DEFAULT_XY_TOLERANCE = "xy_tolerance", 0.01
+DOCS[CONF_XY_TOLERANCE] = "xy color distance treated as already restored"
+
+CALL_ORDER_ZONE = "zone"
+CALL_ORDER_LARGEST_FIRST = "largest_first"
+CONF_CALL_ORDER, DEFAULT_CALL_ORDER = "call_order", CALL_ORDER_LARGEST_FIRST
+DOCS[CONF_CALL_ORDER] = "Order of grouped light commands when restoring scenes"
+
+CONF_COMMAND_RATE, DEFAULT_COMMAND_RATE = "command_rate", 5
+DOCS[CONF_COMMAND_RATE] = "Maximum zone light commands sent per second"
+
+CONF_ZONE_CONCURRENCY, DEFAULT_ZONE_CONCURRENCY = "zone_concurrency", 2
+DOCS[CONF_ZONE_CONCURRENCY] = "Light commands this zone can have in flight at once"
+
+CONF_COMMAND_TIMEOUT, DEFAULT_COMMAND_TIMEOUT = "command_timeout", 5
+DOCS[CONF_COMMAND_TIMEOUT] = "Seconds to wait for a light command before moving on"
+
+CONF_VERIFY_WINDOW, DEFAULT_VERIFY_WINDOW = "verify_window", 0
+DOCS[CONF_VERIFY_WINDOW] = "Seconds to check a restored scene, 0 to disable"
+
+CONF_VERIFY_RETRIES, DEFAULT_VERIFY_RETRIES = "verify_retries", 2
+DOCS[CONF_VERIFY_RETRIES] = "Times a scene is re-sent to lights that didn't reach it"
+
 
 class OptionParams(TypedDict):
     name: str
@@ -64,7 +96,18 @@ OPTIONS_LIST = [
                 multiple=True,
             )
         ),
-        True,
+    ),
+    opt(
+        CONF_ZONES,
+        DEFAULT_ZONES,
+        cv.entity_ids,
+        select.EntitySelector(
+            select.EntitySelectorConfig(
+                domain="light",
+                integration=DOMAIN,
+                multiple=True,
+            )
+        ),
     ),
     opt(
         CONF_SCENES,
@@ -102,17 +145,129 @@ OPTIONS_LIST = [
         ),
         True,
     ),
+    opt(
+        CONF_BRIGHTNESS_TOLERANCE,
+        DEFAULT_BRIGHTNESS_TOLERANCE,
+        vol.All(vol.Coerce(int), vol.Range(min=0, max=255)),
+        select.NumberSelector(
+            select.NumberSelectorConfig(
+                min=0, max=255, mode=select.NumberSelectorMode.BOX
+            )
+        ),
+    ),
+    opt(
+        CONF_COLOR_TEMP_TOLERANCE,
+        DEFAULT_COLOR_TEMP_TOLERANCE,
+        vol.All(vol.Coerce(int), vol.Range(min=0)),
+        select.NumberSelector(
+            select.NumberSelectorConfig(
+                min=0,
+                max=1000,
+                unit_of_measurement="K",
+                mode=select.NumberSelectorMode.BOX,
+            )
+        ),
+    ),
+    opt(
+        CONF_XY_TOLERANCE,
+        DEFAULT_XY_TOLERANCE,
+        vol.All(vol.Coerce(float), vol.Range(min=0, max=1)),
+        select.NumberSelector(
+            select.NumberSelectorConfig(
+                min=0, max=1, step=0.001, mode=select.NumberSelectorMode.BOX
+            )
+        ),
+    ),
+    opt(
+        CONF_CALL_ORDER,
+        DEFAULT_CALL_ORDER,
+        vol.In([CALL_ORDER_ZONE, CALL_ORDER_LARGEST_FIRST]),
+        select.SelectSelector(
+            select.SelectSelectorConfig(
+                options=[CALL_ORDER_ZONE, CALL_ORDER_LARGEST_FIRST],
+            )
+        ),
+    ),
+    opt(
+        CONF_COMMAND_RATE,
+        DEFAULT_COMMAND_RATE,
+        vol.All(vol.Coerce(float), vol.Range(min=0.1, max=100)),
+        select.NumberSelector(
+            select.NumberSelectorConfig(
+                min=0.1, max=100, step=0.1, mode=select.NumberSelectorMode.BOX
+            )
+        ),
+    ),
+    opt(
+        CONF_ZONE_CONCURRENCY,
+        DEFAULT_ZONE_CONCURRENCY,
+        vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+        select.NumberSelector(
+            select.NumberSelectorConfig(
+                min=1, max=100, mode=select.NumberSelectorMode.BOX
+            )
+        ),
+    ),
+    opt(
+        CONF_COMMAND_TIMEOUT,
+        DEFAULT_COMMAND_TIMEOUT,
+        vol.All(vol.Coerce(float), vol.Range(min=0.1, max=120)),
+        select.NumberSelector(
+            select.NumberSelectorConfig(
+                min=0.1,
+                max=120,
+                step=0.1,
+                unit_of_measurement="s",
+                mode=select.NumberSelectorMode.BOX,
+            )
+        ),
+    ),
+    opt(
+        CONF_VERIFY_WINDOW,
+        DEFAULT_VERIFY_WINDOW,
+        vol.All(vol.Coerce(float), vol.Range(min=0, max=60)),
+        select.NumberSelector(
+            select.NumberSelectorConfig(
+                min=0,
+                max=60,
+                step=0.5,
+                unit_of_measurement="s",
+                mode=select.NumberSelectorMode.BOX,
+            )
+        ),
+    ),
+    opt(
+        CONF_VERIFY_RETRIES,
+        DEFAULT_VERIFY_RETRIES,
+        vol.All(vol.Coerce(int), vol.Range(min=0, max=10)),
+        select.NumberSelector(
+            select.NumberSelectorConfig(
+                min=0, max=10, mode=select.NumberSelectorMode.BOX
+            )
+        ),
+    ),
 ]
 
 ACTIVATION_SWITCH = "activation_switch"
 UNDO_UPDATE_LISTENER = "undo_update_listener"
 COORDINATOR = "coordinator"
+HUB = "hub"
+SCHEDULER = "scheduler"
+TRIGGERS = "triggers"
+ZONE_CONFIGS = "zone_configs"
+
+# Lights commanded per second across all zones, set with SERVICE_SET_SCHEDULER_RATE
+DEFAULT_SCHEDULER_RATE = 20
 
 SELECT_SCENE = "select_scene"
 SELECT_CONTROLLER = "select_controller"
 
 ATTR_PREVIOUS_STATE = "previous_state"
 ATTR_ENTITIES = "entities"
+ATTR_LIGHT_COUNT = "light_count"
+ATTR_SNAPSHOT_HASH = "snapshot_hash"
+ATTR_SAVED_AT = "saved_at"
+ATTR_RATE = "rate"
 
 MANUAL = "Manual"
 
@@ -123,6 +278,8 @@ ACTION_ACTIVATE = "activate_scene"
 ACTION_DEACTIVATE = "deactivate_scene"
 
 SERVICE_ROLLBACK_SELECT = "rollback_select"
+SERVICE_GET_SNAPSHOT = "get_snapshot"
+SERVICE_SET_SCHEDULER_RATE = "set_scheduler_rate"
 
 _DOMAIN_SCHEMA = vol.Schema(
     {
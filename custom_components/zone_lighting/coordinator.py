@@ -2,47 +2,106 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any
+import time
+from collections import Counter, deque
+from contextlib import contextmanager, suppress
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
+import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    ATTR_STATE,
     CONF_DEVICE_ID,
+    STATE_ON,
+    STATE_UNAVAILABLE,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Context, CoreState, Event, HomeAssistant, callback
 from homeassistant.helpers import device_registry, entity_registry
 from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
 )
+from homeassistant.util import dt as dt_util
 from homeassistant.util import slugify
 
+from .commands import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    async_get_scheduler,
+)
 from .const import (
     ACTION_ACTIVATE,
     ACTION_DEACTIVATE,
     CONF_EVENT_ACTION,
     CONF_EVENT_SCENE,
-    CONF_LIGHTS,
-    CONF_NAME,
-    CONF_SCENES,
-    CONF_SCENES_EVENT,
+    COORDINATOR,
     DOMAIN,
     ZONE_LIGHTING_EVENT,
 )
+from .hub import async_get_hub
+from .model import (
+    MODEL_CONTROLLER,
+    MODEL_LIGHTS,
+    MODEL_OPTIONS,
+    MODEL_SCENE,
+    MODEL_SCENE_STATES,
+    MODEL_STATE,
+    ZoneModel,
+)
+from .snapshot import (
+    RESTORABLE_STATES,
+    LightCall,
+    SceneSummary,
+    VerificationPass,
+    decode_scene_calls,
+    diff_scene_states,
+    encode_light_state,
+    encode_scene_states,
+    group_light_calls,
+    light_call_target,
+    light_state_differs,
+)
+from .store import ZoneStore
 from .util import (
     MANUAL,
     ListType,
-    async_get_scene_entity_id,
-    get_conf_list,
-    get_conf_list_plain,
+    ZoneConfig,
+    async_get_zone_config,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+    from datetime import datetime
+
 _LOGGER = logging.getLogger(__name__)
 
-MODEL_SCENE = "scene"
-MODEL_CONTROLLER = "controller"
-MODEL_STATE = "on_state"
-MODEL_SCENE_STATES = "scene_states"
+# Longest a startup restore waits for unavailable lights of the scene
+STARTUP_AVAILABILITY_TIMEOUT = 60
+
+# Number of scene verification passes kept for inspection
+VERIFICATION_HISTORY = 50
+
+LIST_TYPES = {MODEL_SCENE: ListType.SCENE, MODEL_CONTROLLER: ListType.CONTROLLER}
+
+# Topics whose model sections are persisted in the zone store
+STORED_TOPICS = frozenset({MODEL_STATE, MODEL_SCENE, MODEL_CONTROLLER})
+
+# Store key for when each scene snapshot was saved
+STORED_SAVED_AT = "scene_saved_at"
+
+# Store key for member lights renamed since they were added to the options
+STORED_RENAMED_LIGHTS = "renamed_lights"
+
+
+def scene_states_topic(scene: str) -> str:
+    """Topic listeners use to follow the saved states of a single scene."""
+    return f"{MODEL_SCENE_STATES}_{scene}"
 
 
 class ZoneLightingCoordinator(DataUpdateCoordinator):
@@ -51,14 +110,14 @@ class ZoneLightingCoordinator(DataUpdateCoordinator):
     config_entry: ConfigEntry
     zone_name: str
 
-    _model: dict[str, Any]
-    _device_id = None
-    _light_entity_ids = None
+    _model: ZoneModel
+    _device_id: str | None = None
+    _light_entity_ids: list[str]
 
     def __init__(
         self,
         hass: HomeAssistant,
-        config_data: dict[str, Any],
+        config: ZoneConfig,
     ) -> None:
         """Initialize."""
         super().__init__(
@@ -67,23 +126,34 @@ class ZoneLightingCoordinator(DataUpdateCoordinator):
             name=DOMAIN,
             always_update=False,
         )
-        self.config_data = config_data
+        self.config = config
         self.device_identifiers = {(DOMAIN, self.config_entry.entry_id)}
-        self.zone_name = self.config_data[CONF_NAME]
-
-        self._simple_scenes = get_conf_list_plain(self.config_data, CONF_SCENES)
-        self._event_scenes = get_conf_list_plain(self.config_data, CONF_SCENES_EVENT)
+        self.zone_name = config.name
 
         self._scene_restored = False
+        self._scene_calls: dict[str, dict[str, LightCall]] = {}
+        self._restore_task: asyncio.Task | None = None
+        self._restore_scene: str | None = None
+        self.command_timeouts: Counter[str] = Counter()
+        self.verification_passes: deque[VerificationPass] = deque(
+            maxlen=VERIFICATION_HISTORY
+        )
+        self._verify_task: asyncio.Task | None = None
+        self._scheduler = async_get_scheduler(hass)
+        self._async_apply_command_options()
+        self.config_entry.async_on_unload(
+            partial(self._scheduler.async_remove_zone, self.config_entry.entry_id)
+        )
 
-        scenes = get_conf_list(self.config_data, ListType.SCENE)
-        controllers = get_conf_list(self.config_data, ListType.CONTROLLER)
-        self._model = {
-            MODEL_STATE: False,
-            MODEL_SCENE: dict(values=scenes, current=None, previous=None),
-            MODEL_CONTROLLER: dict(values=controllers, current=None, previous=None),
-            MODEL_SCENE_STATES: dict(),
-        }
+        self._batch_depth = 0
+        self._batch_topics: set[str] = set()
+        self._batch_scene_actions: dict[str, str] = {}
+        self._restore_phase = False
+
+        self._model = ZoneModel(config.scene_options, config.controller_options)
+
+        self._store = ZoneStore(hass, self.config_entry.entry_id)
+        self.restored = False
 
         self._save_current_scene_debouncer = Debouncer(
             hass,
@@ -93,51 +163,484 @@ class ZoneLightingCoordinator(DataUpdateCoordinator):
             function=self._async_save_current_scene,
         )
 
-    @property
-    def light_entity_ids(self):
-        if not self._light_entity_ids:
-            registry = entity_registry.async_get(self.hass)
-            self._light_entity_ids = entity_registry.async_validate_entity_ids(
-                registry, self.config_data[CONF_LIGHTS]
+        self._unsub_child_zones: dict[str, Callable[[], None]] = {}
+        self._renamed_lights: dict[str, str] = {}
+        self._light_entity_ids = self._async_resolve_light_entity_ids()
+        self.config_entry.async_on_unload(self._async_unsub_child_zones)
+        self._async_resolve_device_id()
+        self.config_entry.async_on_unload(
+            hass.bus.async_listen(
+                entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+                self._async_entity_registry_updated,
+                event_filter=self._async_filter_entity_registry_event,
+            )
+        )
+        self.config_entry.async_on_unload(
+            hass.bus.async_listen(
+                device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+                self._async_device_registry_updated,
+                event_filter=self._async_filter_device_registry_event,
             )
+        )
+
+    @callback
+    def _async_apply_command_options(self) -> None:
+        config = self.config
+        self.restore_tolerances = config.restore_tolerances
+        self.call_order = config.call_order
+        self.command_interval = 1 / config.command_rate
+        self.command_timeout = config.command_timeout
+        self.verify_window = config.verify_window
+        self.verify_retries = config.verify_retries
+        self._scheduler.async_set_zone(
+            self.config_entry.entry_id, config.zone_concurrency
+        )
+
+    @callback
+    def async_update_config(self, config: ZoneConfig) -> None:
+        """
+        Apply changed options to the running zone without a reload.
+
+        The on state, selections and snapshots of scenes that still exist are
+        kept, and listeners are only notified for the parts that changed.
+        """
+        # Scene actions run against the new config, where an event scene that
+        # was removed is no longer one, so its deactivation is fired here
+        current = self._model.scene.current
+        if (
+            self._model.on
+            and current in self.config.event_scene_set
+            and current not in config.event_scene_set
+        ):
+            self._async_fire_scene_event(ACTION_DEACTIVATE, current)
+
+        old_config, self.config = self.config, config
+        with self.async_batch():
+            self._async_apply_command_options()
+            self._async_data_changed(MODEL_OPTIONS)
+
+            if (old_config.lights, old_config.zones) != (config.lights, config.zones):
+                light_entity_ids = self._async_resolve_light_entity_ids()
+                if light_entity_ids != self._light_entity_ids:
+                    self._light_entity_ids = light_entity_ids
+                    self._async_data_changed(MODEL_LIGHTS)
+
+            self._async_update_list(MODEL_SCENE, config.scene_options)
+            if config.simple_scenes != old_config.simple_scenes:
+                self._async_data_changed(MODEL_SCENE)
+            for scene in self._model.scene_states.keys() - config.simple_scene_set:
+                self._model.remove_scene_states(scene)
+                self._scene_calls.pop(scene, None)
+                self._async_data_changed(scene_states_topic(scene))
+
+            self._async_update_list(MODEL_CONTROLLER, config.controller_options)
+
+    @callback
+    def _async_update_list(self, type: str, values: tuple[str, ...]) -> None:
+        """Replace the values of a list, moving off a current value that's gone."""
+        list_state = self._model.get_list(type)
+        if values == list_state.values:
+            return
+        if list_state.current is not None and not self.config.is_option(
+            LIST_TYPES[type], list_state.current
+        ):
+            self.async_set_current_list_val(type, MANUAL)
+        self._model.set_list(type, self._model.get_list(type).with_values(values))
+        self._async_data_changed(type)
+
+    @property
+    def light_entity_ids(self) -> list[str]:
         return self._light_entity_ids
 
     @property
-    def device_id(self):
-        if not self._device_id:
-            entry = device_registry.async_get(self.hass).async_get_device(
-                self.device_identifiers
-            )
-            if entry:
-                self._device_id = entry.id
+    def device_id(self) -> str | None:
         return self._device_id
 
-    def _async_data_changed(self):
-        self.async_set_updated_data(self._model)
+    @callback
+    def _async_resolve_light_entity_ids(self) -> list[str]:
+        """
+        Resolve the zone's lights, expanding child zones into their lights.
+
+        Lights shared between children are only included once, in the order
+        they are first found.
+        """
+        registry = entity_registry.async_get(self.hass)
+        entity_ids: dict[str, None] = {}
+        child_entries: dict[str, ConfigEntry] = {}
+        self._async_collect_lights(
+            registry,
+            self.config,
+            entity_ids,
+            child_entries,
+            {self.config_entry.entry_id},
+        )
+        self._async_track_child_zones(child_entries)
+        return list(entity_ids)
+
+    @callback
+    def _async_collect_lights(
+        self,
+        registry: entity_registry.EntityRegistry,
+        config: ZoneConfig,
+        entity_ids: dict[str, None],
+        child_entries: dict[str, ConfigEntry],
+        visited: set[str],
+    ) -> None:
+        for entity_id in config.lights:
+            try:
+                entity_id = entity_registry.async_validate_entity_id(
+                    registry, entity_id
+                )
+                entity_ids.setdefault(self._renamed_lights.get(entity_id, entity_id))
+            except vol.Invalid:
+                _LOGGER.warning("%s: unknown light %s", self.zone_name, entity_id)
+
+        for zone_entity_id in config.zones:
+            entry = registry.async_get(zone_entity_id)
+            if entry is None or entry.platform != DOMAIN:
+                _LOGGER.warning("%s: unknown zone %s", self.zone_name, zone_entity_id)
+                continue
+            if entry.config_entry_id in visited:
+                _LOGGER.debug(
+                    "%s: zone %s already included", self.zone_name, zone_entity_id
+                )
+                continue
+            visited.add(entry.config_entry_id)
+            if (
+                child_entry := self.hass.config_entries.async_get_entry(
+                    entry.config_entry_id
+                )
+            ) is None:
+                continue
+            child_entries[child_entry.entry_id] = child_entry
+            self._async_collect_lights(
+                registry,
+                async_get_zone_config(self.hass, child_entry),
+                entity_ids,
+                child_entries,
+                visited,
+            )
+
+    @callback
+    def _async_track_child_zones(self, child_entries: dict[str, ConfigEntry]) -> None:
+        """Listen for option changes of every zone contained in this one."""
+        for entry_id in self._unsub_child_zones.keys() - child_entries.keys():
+            self._unsub_child_zones.pop(entry_id)()
+        for entry_id, entry in child_entries.items():
+            if entry_id not in self._unsub_child_zones:
+                self._unsub_child_zones[entry_id] = entry.add_update_listener(
+                    self._async_child_zone_updated
+                )
+
+    @callback
+    def _async_unsub_child_zones(self) -> None:
+        for unsub in self._unsub_child_zones.values():
+            unsub()
+        self._unsub_child_zones.clear()
+
+    async def _async_child_zone_updated(
+        self,
+        hass: HomeAssistant,  # noqa: ARG002
+        entry: ConfigEntry,  # noqa: ARG002
+    ) -> None:
+        light_entity_ids = self._async_resolve_light_entity_ids()
+        if light_entity_ids != self._light_entity_ids:
+            self._light_entity_ids = light_entity_ids
+            self._async_data_changed(MODEL_LIGHTS)
+
+    @callback
+    def _async_resolve_device_id(self) -> None:
+        entry = device_registry.async_get(self.hass).async_get_device(
+            self.device_identifiers
+        )
+        self._device_id = entry.id if entry else None
+
+    @callback
+    def _async_filter_entity_registry_event(self, event_data: dict[str, Any]) -> bool:
+        if event_data["action"] == "update":
+            return event_data.get("old_entity_id") in self._light_entity_ids
+        if event_data["action"] == "remove":
+            return event_data["entity_id"] in self._light_entity_ids
+        return event_data["entity_id"] in self.config.member_set
+
+    @callback
+    def _async_entity_registry_updated(self, event: Event) -> None:
+        """Follow renames and removals of member lights without a reload."""
+        with self.async_batch():
+            self._async_apply_entity_registry_change(event)
+            self._async_data_changed(MODEL_LIGHTS)
+
+    @callback
+    def _async_apply_entity_registry_change(self, event: Event) -> None:
+        action = event.data["action"]
+        entity_id = event.data["entity_id"]
+        if action == "update":
+            old_entity_id = event.data["old_entity_id"]
+            _LOGGER.debug(
+                "%s: %s renamed to %s", self.zone_name, old_entity_id, entity_id
+            )
+            self._light_entity_ids = [
+                entity_id if light == old_entity_id else light
+                for light in self._light_entity_ids
+            ]
+            self._async_rename_light(old_entity_id, entity_id)
+        elif action == "remove":
+            self._light_entity_ids = [
+                light for light in self._light_entity_ids if light != entity_id
+            ]
+        else:
+            self._light_entity_ids = self._async_resolve_light_entity_ids()
+
+    @callback
+    def _async_rename_light(self, old_entity_id: str, entity_id: str) -> None:
+        """
+        Move snapshots to a renamed light and remember the rename.
+
+        Options still name the old id, so the rename is applied whenever the
+        lights are resolved again.
+        """
+        self._renamed_lights = {
+            old: entity_id if new == old_entity_id else new
+            for old, new in self._renamed_lights.items()
+            if old != entity_id
+        }
+        self._renamed_lights[old_entity_id] = entity_id
+        self._scene_calls.clear()
+        for scene in self._model.rename_light(old_entity_id, entity_id):
+            self._async_data_changed(scene_states_topic(scene))
+        self._store.async_schedule_save(self._async_store_data)
+
+    @callback
+    def _async_filter_device_registry_event(self, event_data: dict[str, Any]) -> bool:
+        if self._device_id is None:
+            return event_data["action"] == "create"
+        return event_data["action"] == "remove" and (
+            event_data["device_id"] == self._device_id
+        )
+
+    @callback
+    def _async_device_registry_updated(self, event: Event) -> None:
+        self._async_resolve_device_id()
+
+    def _async_data_changed(self, *topics: str):
+        """Publish the model, waking only listeners subscribed to a changed topic.
+
+        Listeners registered without a context still receive every update.
+        """
+        if self._batch_depth:
+            self._batch_topics.update(topics)
+            return
+        changed = set(topics)
+        self._model.bump(changed)
+        self.data = self._model.snapshot()
+        self.last_update_success = True
+        if changed & STORED_TOPICS or any(
+            topic.startswith(MODEL_SCENE_STATES) for topic in changed
+        ):
+            self._store.async_schedule_save(self._async_store_data)
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or not changed.isdisjoint(context):
+                update_callback()
 
     async def _async_update_data(self):
-        return self._model
+        return self._model.snapshot()
+
+    async def async_load(self) -> None:
+        """
+        Load the zone's saved state into the model.
+
+        If the zone has never been stored, entities restore their pieces from
+        restore state as before and the next change writes the store.
+        """
+        data = await self._store.async_load()
+        if data is None:
+            return
+
+        self._model.on = bool(data.get(MODEL_STATE))
+        for type in (MODEL_SCENE, MODEL_CONTROLLER):
+            saved = data.get(type) or {}
+            list_state = self._model.get_list(type)
+            self._model.set_list(
+                type,
+                list_state._replace(
+                    **{
+                        key: saved[key]
+                        for key in ("current", "previous")
+                        if list_state.is_option(saved.get(key))
+                    }
+                ),
+            )
+        if renamed_lights := data.get(STORED_RENAMED_LIGHTS):
+            self._renamed_lights = dict(renamed_lights)
+            self._light_entity_ids = self._async_resolve_light_entity_ids()
+        saved_at = data.get(STORED_SAVED_AT) or {}
+        self._model.load_scene_states(
+            {
+                scene: encode_scene_states(states)
+                for scene, states in (data.get(MODEL_SCENE_STATES) or {}).items()
+                if scene in self.config.simple_scene_set
+            },
+            {
+                scene: dt_util.parse_datetime(value)
+                for scene, value in saved_at.items()
+                if isinstance(value, str)
+            },
+        )
+        self.restored = True
+
+    @callback
+    def _async_store_data(self) -> dict[str, Any]:
+        return {
+            MODEL_STATE: self._model.on,
+            **{
+                type: {
+                    "current": self._model.get_list(type).current,
+                    "previous": self._model.get_list(type).previous,
+                }
+                for type in (MODEL_SCENE, MODEL_CONTROLLER)
+            },
+            MODEL_SCENE_STATES: dict(self._model.scene_states),
+            STORED_RENAMED_LIGHTS: self._renamed_lights,
+            STORED_SAVED_AT: {
+                scene: summary.saved_at.isoformat()
+                for scene, summary in self._model.scene_summaries.items()
+                if summary.saved_at is not None
+            },
+        }
+
+    async def async_remove_store(self) -> None:
+        await self._store.async_remove()
 
     def _is_simple_scene(self, scene: str):
         if not scene or scene == MANUAL:
             return False
 
-        return scene in self._simple_scenes
+        return scene in self.config.simple_scene_set
 
     @property
     def simple_scenes(self):
-        return self._simple_scenes
+        return self.config.simple_scenes
+
+    @contextmanager
+    def async_batch(self):
+        """
+        Collect model mutations and scene actions until the outermost batch exits.
+
+        On exit listeners are notified once for all changed topics, and only the
+        last action requested for each scene runs, deactivations first.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._async_commit_batch()
+
+    @contextmanager
+    def async_restore_phase(self):
+        """
+        Batch everything entities restore while being set up into one update.
+
+        Scene restores started by it wait for Home Assistant to start and for
+        the scene's lights to become available before commanding them.
+        """
+        self._restore_phase = True
+        try:
+            with self.async_batch():
+                yield self
+        finally:
+            self._restore_phase = False
+
+    def _async_commit_batch(self):
+        topics, self._batch_topics = self._batch_topics, set()
+        actions, self._batch_scene_actions = self._batch_scene_actions, {}
+        for action in (ACTION_DEACTIVATE, ACTION_ACTIVATE):
+            for scene, scene_action in actions.items():
+                if scene_action == action:
+                    self._async_run_scene_action(action, scene)
+        if topics:
+            self._async_data_changed(*topics)
 
     def _async_handle_scene_action(self, action: str, scene: str):
         if not scene or scene == MANUAL:
             return
 
-        if scene in self._event_scenes:
+        if self._batch_depth:
+            self._batch_scene_actions.pop(scene, None)
+            self._batch_scene_actions[scene] = action
+            return
+
+        self._async_run_scene_action(action, scene)
+
+    def _async_run_scene_action(self, action: str, scene: str):
+        if action == ACTION_ACTIVATE and self._model.on and not self._restore_phase:
+            # The scene sets every light of the zone, those of child zones too
+            self.async_update_child_zones()
+        if scene in self.config.event_scene_set:
             self._async_fire_scene_event(action, scene)
             return
 
         if action == ACTION_ACTIVATE:
-            self.hass.add_job(self._async_restore_scene_state, scene)
+            self._async_schedule_restore(scene)
+        elif self._restore_scene == scene:
+            self._async_cancel_restore()
+
+    @callback
+    def _async_schedule_restore(
+        self, scene: str, context: Context | None = None
+    ) -> asyncio.Task:
+        """Restore a scene, superseding any restore still in flight."""
+        self._async_cancel_restore()
+        self._restore_scene = scene
+        startup = self._restore_phase or self.hass.state is not CoreState.running
+        self._restore_task = self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_restore_scene_state(scene, context, startup),
+            f"{DOMAIN} {self.zone_name} restore {scene}",
+        )
+        return self._restore_task
+
+    @callback
+    def _async_cancel_restore(self) -> None:
+        if self._restore_task and not self._restore_task.done():
+            _LOGGER.debug(
+                "%s: cancelling superseded restore of %s",
+                self.zone_name,
+                self._restore_scene,
+            )
+            self._restore_task.cancel()
+        if self._verify_task and not self._verify_task.done():
+            self._verify_task.cancel()
+        self._restore_task = None
+        self._verify_task = None
+        self._restore_scene = None
+
+    async def async_restore_scene(
+        self, scene: str, context: Context | None = None
+    ) -> bool:
+        """
+        Select and restore a scene, False if a newer restore superseded it.
+
+        The restore started here replaces the one activating the scene would
+        start, so the scene's lights are only commanded once. Errors sending
+        the scene are raised to the caller.
+        """
+        with self.async_batch():
+            self.async_set_current_list_val(MODEL_SCENE, scene)
+            task = self._async_schedule_restore(scene, context)
+            if self._batch_scene_actions.get(scene) == ACTION_ACTIVATE:
+                del self._batch_scene_actions[scene]
+            if self._model.on:
+                self.async_update_child_zones()
+        try:
+            await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.cancelled():
+                # The caller was cancelled, not the restore
+                raise
+            return False
+        return True
 
     def _async_fire_scene_event(self, action: str, scene: str):
         if not self.device_id:
@@ -155,30 +658,30 @@ class ZoneLightingCoordinator(DataUpdateCoordinator):
         return f"zone_lighting_{slugify(self.zone_name)}_{slugify(scene)}"
 
     def async_save_current_scene(self):
-        if not self._model[MODEL_STATE]:
+        if not self._model.on:
             return
         self.hass.add_job(self._save_current_scene_debouncer.async_call)
 
     def _async_save_current_scene(self):
-        if not self._model[MODEL_STATE]:
+        if not self._model.on:
             return
 
-        scene = self._model[MODEL_SCENE]["current"]
+        scene = self._model.scene.current
         if self._is_simple_scene(scene):
             entity_states = dict()
             for entity_id in self.light_entity_ids:
                 state = self.hass.states.get(entity_id)
-                entity_states[entity_id] = {
-                    "state": state.state,
-                    **state.attributes,
-                }
-            self._model[MODEL_SCENE_STATES][scene] = entity_states
-            self._async_data_changed()
+                if state is None or state.state not in RESTORABLE_STATES:
+                    continue
+                entity_states[entity_id] = encode_light_state(state)
+            self._model.set_scene_states(scene, entity_states, dt_util.utcnow())
+            self._scene_calls.pop(scene, None)
+            self._async_data_changed(scene_states_topic(scene))
 
             # self.hass.add_job(self._async_save_scene_state, scene)
 
     async def _async_save_scene_state(self, scene):
-        if not self._model[MODEL_STATE]:
+        if not self._model.on:
             return
 
         if not self._scene_restored:
@@ -192,71 +695,394 @@ class ZoneLightingCoordinator(DataUpdateCoordinator):
         }
         (await self.hass.services.async_call("scene", "create", data),)
 
-    async def _async_restore_scene_state(self, scene):
+    async def _async_restore_scene_state(self, scene, context=None, startup=False):
         _LOGGER.debug(f"Restoring scene state: {scene}")
-        # target = dict(entity_id=f"scene.{self._get_saved_scene_id(scene)}")
-        # await self.hass.services.async_call("scene", "turn_on", target=target)
-        entity_id = async_get_scene_entity_id(
-            self.hass, self.config_entry.entry_id, scene
-        )
-        _LOGGER.debug(entity_id)
-        if not entity_id:
-            _LOGGER.debug("Can't save, no entity id")
+        if self.get_scene_states(scene) is None:
+            _LOGGER.debug("Can't restore, no saved state for %s", scene)
             return
-        target = dict(entity_id=entity_id)
-        await self.hass.services.async_call("scene", "turn_on", target=target)
+        # Restores started while Home Assistant is starting yield to commands
+        # from users, so zones restoring at boot don't flood the network
+        priority = PRIORITY_INTERACTIVE
+        if startup:
+            priority = PRIORITY_BACKGROUND
+            await self._async_wait_for_startup(scene)
+        await self.async_apply_scene(scene, context, priority)
         self._scene_restored = True
+        if self.verify_window:
+            self._verify_task = self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_verify_scene(scene, context),
+                f"{DOMAIN} {self.zone_name} verify {scene}",
+            )
+
+    async def _async_wait_for_startup(self, scene: str) -> None:
+        """Wait for Home Assistant to start and the scene's lights to be available."""
+        if self.hass.state is not CoreState.running:
+            started = self.hass.loop.create_future()
+
+            @callback
+            def _async_started(hass: HomeAssistant) -> None:  # noqa: ARG001
+                if not started.done():
+                    started.set_result(None)
+
+            unsub = async_at_started(self.hass, _async_started)
+            try:
+                await started
+            finally:
+                # The listener is gone once it has fired
+                if not started.done() or started.cancelled():
+                    unsub()
+
+        unavailable = {
+            entity_id
+            for entity_id in self.get_scene_states(scene) or {}
+            if (state := self.hass.states.get(entity_id)) is None
+            or state.state == STATE_UNAVAILABLE
+        }
+        if not unavailable:
+            return
+
+        _LOGGER.debug(
+            "%s: waiting for %s before restoring %s",
+            self.zone_name,
+            unavailable,
+            scene,
+        )
+        available = asyncio.Event()
+
+        @callback
+        def _async_state_changed(event: Event) -> None:
+            new_state = event.data["new_state"]
+            if new_state is not None and new_state.state != STATE_UNAVAILABLE:
+                unavailable.discard(event.data["entity_id"])
+                if not unavailable:
+                    available.set()
+
+        unsub = async_track_state_change_event(
+            self.hass, list(unavailable), _async_state_changed
+        )
+        try:
+            with suppress(TimeoutError):
+                async with asyncio.timeout(STARTUP_AVAILABILITY_TIMEOUT):
+                    await available.wait()
+        finally:
+            unsub()
+
+    def _get_scene_calls(self, scene: str) -> dict[str, LightCall]:
+        if scene not in self._scene_calls:
+            self._scene_calls[scene] = decode_scene_calls(
+                self._model.scene_states.get(scene) or {}
+            )
+        return self._scene_calls[scene]
+
+    async def async_apply_scene(
+        self,
+        scene: str,
+        context: Context | None = None,
+        priority: int = PRIORITY_INTERACTIVE,
+    ) -> int:
+        """
+        Send the light calls that restore a scene, returning the skipped count.
+
+        Lights are commanded directly and concurrently, without going through
+        the scene integration.
+        """
+        start = time.monotonic()
+        entities, skipped = self.async_diff_scene_states(scene)
+        scene_calls = self._get_scene_calls(scene)
+        async_get_hub(self.hass).async_set_scene_owner(
+            self.config_entry.entry_id, scene_calls
+        )
+        calls = await self._async_send_scene_calls(scene, entities, context, priority)
+        _LOGGER.debug(
+            "%s: applied %s with %d calls in %.3fs",
+            self.zone_name,
+            scene,
+            calls,
+            time.monotonic() - start,
+        )
+        return skipped
+
+    async def _async_send_scene_calls(
+        self,
+        scene: str,
+        entity_ids: Iterable[str],
+        context: Context | None,
+        priority: int,
+    ) -> int:
+        """Send the grouped calls for some lights of a scene, returning their count."""
+        scene_calls = self._get_scene_calls(scene)
+        calls = group_light_calls(
+            {
+                entity_id: scene_calls[entity_id]
+                for entity_id in entity_ids
+                if entity_id in scene_calls
+            },
+            self.call_order,
+        )
+        await asyncio.gather(
+            *(
+                self.async_call_light(service, data, context, priority)
+                for service, data in calls
+            )
+        )
+        return len(calls)
+
+    async def _async_verify_scene(self, scene: str, context: Context | None) -> None:
+        """
+        Re-send a restored scene only to lights that didn't reach it.
+
+        Each pass waits up to the verification window for the lights to
+        converge and is recorded in verification_passes.
+        """
+        pending = dict(self.get_scene_states(scene) or {})
+        lights = len(pending)
+        for attempt in range(self.verify_retries + 1):
+            pending = await self._async_wait_converged(pending)
+            self.verification_passes.append(
+                VerificationPass(scene, attempt, lights, tuple(pending))
+            )
+            if not pending:
+                return
+            if attempt < self.verify_retries:
+                _LOGGER.debug(
+                    "%s: re-sending %s to %s", self.zone_name, scene, list(pending)
+                )
+                await self._async_send_scene_calls(
+                    scene, pending, context, PRIORITY_BACKGROUND
+                )
+        _LOGGER.warning(
+            "%s: lights %s didn't reach %s after %d retries",
+            self.zone_name,
+            list(pending),
+            scene,
+            self.verify_retries,
+        )
+
+    async def _async_wait_converged(
+        self, targets: Mapping[str, Mapping[str, Any]]
+    ) -> dict[str, Mapping[str, Any]]:
+        """Wait up to the verification window, returning lights still differing."""
+        pending = {
+            entity_id: target
+            for entity_id, target in targets.items()
+            if light_state_differs(
+                target, self.hass.states.get(entity_id), self.restore_tolerances
+            )
+        }
+        if not pending:
+            return pending
+
+        converged = asyncio.Event()
+
+        @callback
+        def _async_state_changed(event: Event) -> None:
+            entity_id = event.data["entity_id"]
+            if entity_id in pending and not light_state_differs(
+                pending[entity_id], event.data["new_state"], self.restore_tolerances
+            ):
+                del pending[entity_id]
+                if not pending:
+                    converged.set()
+
+        unsub = async_track_state_change_event(
+            self.hass, list(pending), _async_state_changed
+        )
+        try:
+            with suppress(TimeoutError):
+                async with asyncio.timeout(self.verify_window):
+                    await converged.wait()
+        finally:
+            unsub()
+        return pending
+
+    async def async_call_light(
+        self,
+        service: str,
+        data: dict[str, Any],
+        context: Context | None = None,
+        priority: int = PRIORITY_INTERACTIVE,
+    ) -> bool:
+        """
+        Call a light service through the scheduler shared by all zones.
+
+        Unavailable lights are left out, and the call is given up on after the
+        command timeout, counting a timeout for each light that hasn't reached
+        the call's target by then. Returns whether all targeted lights were
+        commanded in time.
+        """
+        entity_ids = data[ATTR_ENTITY_ID]
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+        available = [
+            entity_id
+            for entity_id in entity_ids
+            if (state := self.hass.states.get(entity_id)) is not None
+            and state.state != STATE_UNAVAILABLE
+        ]
+        if len(available) < len(entity_ids):
+            _LOGGER.debug(
+                "%s: skipping unavailable lights %s",
+                self.zone_name,
+                set(entity_ids).difference(available),
+            )
+        if not available:
+            return True
+
+        completed = await self._scheduler.async_call(
+            self.config_entry.entry_id,
+            service,
+            {**data, ATTR_ENTITY_ID: available},
+            priority,
+            context,
+            self.command_timeout,
+        )
+        if not completed:
+            # Only the lights still short of the target held the call up
+            target = light_call_target(service, data)
+            laggards = [
+                entity_id
+                for entity_id in available
+                if light_state_differs(
+                    target, self.hass.states.get(entity_id), self.restore_tolerances
+                )
+            ]
+            _LOGGER.warning(
+                "%s: %s of %s timed out after %ss waiting for %s,"
+                " finishing in the background",
+                self.zone_name,
+                service,
+                available,
+                self.command_timeout,
+                laggards,
+            )
+            self.command_timeouts.update(laggards)
+        return completed
 
     def async_set_on_state(self, on: bool):
-        self._model[MODEL_STATE] = on
+        self._model.on = on
         self._async_handle_scene_action(
             ACTION_ACTIVATE if on else ACTION_DEACTIVATE,
-            self._model[MODEL_SCENE]["current"],
+            self._model.scene.current,
         )
-        self._async_data_changed()
+        self._async_data_changed(MODEL_STATE)
+
+    @callback
+    def async_update_child_zones(self) -> None:
+        """
+        Bring the zones contained in this one in line with what it commanded.
+
+        Called once the zone has commanded all its lights, so child zones take
+        its on state and scene without sending any commands of their own.
+        """
+        on = self._model.on
+        scene = self._model.scene.current
+        states = self.get_scene_states(scene) if on else None
+        if on and states is None and self._is_simple_scene(scene):
+            # Nothing is restored for a scene that was never saved
+            return
+
+        data = self.hass.data[DOMAIN]
+        for entry_id in self._unsub_child_zones:
+            if (child := data.get(entry_id, {}).get(COORDINATOR)) is None:
+                continue
+            child_on = on
+            if states is not None:
+                child_on = any(
+                    states.get(entity_id, {}).get(ATTR_STATE) == STATE_ON
+                    for entity_id in child.light_entity_ids
+                )
+            child.async_follow_parent(child_on, scene)
+
+    @callback
+    def async_follow_parent(self, on: bool, scene: str | None) -> None:
+        """
+        Take the on state and scene a parent zone commanded the lights to.
+
+        A child without the parent's scene switches to Manual, following its
+        lights. No scene action runs, and a restore still in flight is
+        cancelled rather than left to undo the parent's commands.
+        """
+        self._async_cancel_restore()
+        with self.async_batch():
+            if on:
+                if not self.config.is_option(ListType.SCENE, scene):
+                    scene = MANUAL
+                list_state = self._model.scene
+                if scene != list_state.current:
+                    self._model.set_list(MODEL_SCENE, list_state.with_current(scene))
+                    self._async_data_changed(MODEL_SCENE)
+            if on != self._model.on:
+                self._model.on = on
+                self._async_data_changed(MODEL_STATE)
 
     def async_set_current_list_val(self, type: str, value: str):
-        list_model = self._model[type]
-        if value not in list_model["values"]:
+        if not self.config.is_option(LIST_TYPES[type], value):
             return
 
-        if value == list_model["current"]:
+        list_state = self._model.get_list(type)
+        if value == list_state.current:
             return
 
-        list_model["previous"] = list_model["current"]
-        list_model["current"] = value
+        list_state = list_state.with_current(value)
+        self._model.set_list(type, list_state)
 
-        if type == MODEL_SCENE and self._model[MODEL_STATE]:
+        if type == MODEL_SCENE and self._model.on:
             self._save_current_scene_debouncer.async_cancel()
-            self._async_handle_scene_action(ACTION_DEACTIVATE, list_model["previous"])
-            self._async_handle_scene_action(ACTION_ACTIVATE, list_model["current"])
-        self._async_data_changed()
+            self._async_handle_scene_action(ACTION_DEACTIVATE, list_state.previous)
+            self._async_handle_scene_action(ACTION_ACTIVATE, list_state.current)
+        self._async_data_changed(type)
 
     def async_set_previous_list_val(self, type: str, value: str):
-        list_model = self._model[type]
-        if value not in list_model["values"]:
+        if not self.config.is_option(LIST_TYPES[type], value):
             return
-        list_model["previous"] = value
-        self._async_data_changed()
+        list_state = self._model.get_list(type)
+        self._model.set_list(type, list_state._replace(previous=value))
+        self._async_data_changed(type)
 
     def async_rollback_list_val(self, type: str):
-        list_model = self._model[type]
-        self.async_set_current_list_val(type, list_model["previous"])
+        self.async_set_current_list_val(type, self._model.get_list(type).previous)
 
     def get_scene_states(self, scene: str):
-        if not self.data:
-            return None
-        if scene not in self.data[MODEL_SCENE_STATES]:
-            return None
-        return self.data[MODEL_SCENE_STATES][scene]
-
-    def async_set_scene_states(self, scene: str, states: dict[str, any]):
-        self._model[MODEL_SCENE_STATES][scene] = states
-        self._async_data_changed()
-        if self._model[MODEL_STATE] and self._model[MODEL_SCENE]["current"] == scene:
-            self.hass.add_job(self._async_restore_scene_state, scene)
+        return self._model.scene_states.get(scene)
+
+    def get_scene_summary(self, scene: str) -> SceneSummary | None:
+        return self._model.scene_summaries.get(scene)
+
+    def async_diff_scene_states(self, scene: str):
+        """
+        Get the lights in a scene snapshot that don't match their current state.
+
+        Returns the snapshot entries to restore and the number of lights skipped.
+        """
+        states = self.get_scene_states(scene) or {}
+        changed, skipped = diff_scene_states(self.hass, states, self.restore_tolerances)
+        _LOGGER.debug(
+            "%s: restoring %s, %d lights differ, %d skipped",
+            self.zone_name,
+            scene,
+            len(changed),
+            skipped,
+        )
+        return changed, skipped
+
+    def async_set_scene_states(
+        self,
+        scene: str,
+        states: dict[str, any],
+        saved_at: datetime | None = None,
+    ):
+        self._model.set_scene_states(
+            scene, encode_scene_states(states), saved_at or dt_util.utcnow()
+        )
+        self._scene_calls.pop(scene, None)
+        self._async_data_changed(scene_states_topic(scene))
+        if self._model.on and self._model.scene.current == scene:
+            self._async_handle_scene_action(ACTION_ACTIVATE, scene)
 
     async def async_shutdown(self) -> None:
         """Cancel any scheduled call, and ignore new runs."""
         await super().async_shutdown()
+        self._async_cancel_restore()
         await self._save_current_scene_debouncer.async_shutdown()
+        await self._store.async_flush()
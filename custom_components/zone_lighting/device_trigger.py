@@ -7,14 +7,13 @@ from typing import Any
 
 import voluptuous as vol
 from homeassistant.components.device_automation import DEVICE_TRIGGER_BASE_SCHEMA
-from homeassistant.components.homeassistant.triggers import event as event_trigger
 from homeassistant.const import (
     CONF_DEVICE_ID,
     CONF_DOMAIN,
     CONF_PLATFORM,
     CONF_TYPE,
 )
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
 from homeassistant.helpers.typing import ConfigType
@@ -24,10 +23,11 @@ from .const import (
     ACTION_DEACTIVATE,
     CONF_EVENT_ACTION,
     CONF_EVENT_SCENE,
-    CONF_SCENES_EVENT,
     DOMAIN,
+    TRIGGERS,
+    ZONE_LIGHTING_EVENT,
 )
-from .util import filter_conf_list, initialize_with_config
+from .util import async_get_zone_config
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,6 +39,83 @@ TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend(
     }
 )
 
+TriggerKey = tuple[str, str, str]
+
+
+@callback
+def async_get_trigger_dispatcher(hass: HomeAssistant) -> SceneTriggerDispatcher:
+    """Return the trigger dispatcher shared by all zones, creating it on first use."""
+    data = hass.data.setdefault(DOMAIN, {})
+    if (dispatcher := data.get(TRIGGERS)) is None:
+        dispatcher = data[TRIGGERS] = SceneTriggerDispatcher(hass)
+    return dispatcher
+
+
+class SceneTriggerDispatcher:
+    """
+    Run device triggers for zone lighting events from a single bus listener.
+
+    Triggers are indexed by device, action and scene, so an event only runs
+    the automations attached to it instead of being matched by every one.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._triggers: dict[TriggerKey, list[tuple[HassJob, dict[str, Any]]]] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_attach(
+        self,
+        key: TriggerKey,
+        action: TriggerActionType,
+        trigger_info: TriggerInfo,
+    ) -> CALLBACK_TYPE:
+        """Run an action for the events matching a key, returns a remover."""
+        trigger = (
+            HassJob(action, f"{DOMAIN} device trigger {trigger_info}"),
+            trigger_info["trigger_data"],
+        )
+        self._triggers.setdefault(key, []).append(trigger)
+        if self._unsub is None:
+            self._unsub = self.hass.bus.async_listen(
+                ZONE_LIGHTING_EVENT, self._async_handle_event
+            )
+
+        @callback
+        def async_remove() -> None:
+            triggers = self._triggers[key]
+            triggers.remove(trigger)
+            if triggers:
+                return
+            del self._triggers[key]
+            if not self._triggers and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+
+        return async_remove
+
+    @callback
+    def _async_handle_event(self, event: Event) -> None:
+        key = (
+            event.data.get(CONF_DEVICE_ID),
+            event.data.get(CONF_EVENT_ACTION),
+            event.data.get(CONF_EVENT_SCENE),
+        )
+        for job, trigger_data in tuple(self._triggers.get(key, ())):
+            self.hass.async_run_hass_job(
+                job,
+                {
+                    "trigger": {
+                        **trigger_data,
+                        "platform": "device",
+                        "event": event,
+                        "description": f"event '{event.event_type}'",
+                    }
+                },
+                event.context,
+            )
+
 
 async def async_get_triggers(
     hass: HomeAssistant, device_id: str
@@ -52,10 +129,7 @@ async def async_get_triggers(
         if not entry:
             continue
 
-        config_data = await initialize_with_config(hass, entry)
-        event_scenes = filter_conf_list(config_data[CONF_SCENES_EVENT])
-
-        for scene in event_scenes:
+        for scene in async_get_zone_config(hass, entry).event_scenes:
             base_trigger = {
                 CONF_DEVICE_ID: device_id,
                 CONF_DOMAIN: DOMAIN,
@@ -87,25 +161,8 @@ async def async_attach_trigger(
     trigger_info: TriggerInfo,
 ) -> CALLBACK_TYPE:
     """Attach a trigger."""
-    # TODO Implement your own logic to attach triggers.
-    # Use the existing state or event triggers from the automation integration.
-
-    event_config = event_trigger.TRIGGER_SCHEMA(
-        {
-            event_trigger.CONF_PLATFORM: "event",
-            event_trigger.CONF_EVENT_TYPE: "zone_lighting_event",
-            event_trigger.CONF_EVENT_DATA: {
-                CONF_DEVICE_ID: config[CONF_DEVICE_ID],
-                CONF_EVENT_ACTION: config[CONF_EVENT_ACTION],
-                CONF_EVENT_SCENE: config[CONF_EVENT_SCENE],
-            },
-        },
-    )
-
-    return await event_trigger.async_attach_trigger(
-        hass,
-        event_config,
+    return async_get_trigger_dispatcher(hass).async_attach(
+        (config[CONF_DEVICE_ID], config[CONF_EVENT_ACTION], config[CONF_EVENT_SCENE]),
         action,
         trigger_info,
-        platform_type="device",
     )
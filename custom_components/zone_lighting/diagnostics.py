@@ -0,0 +1,31 @@
+"""Diagnostics support for Zone Lighting."""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import TYPE_CHECKING, Any
+
+from .commands import async_get_scheduler
+from .util import get_coordinator
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return the zone's lights and how reliably they take commands."""
+    coordinator = get_coordinator(hass, entry)
+    passes = list(coordinator.verification_passes)
+    stragglers = Counter(
+        entity_id for verification in passes for entity_id in verification.stragglers
+    )
+    return {
+        "lights": coordinator.light_entity_ids,
+        "scheduler_rate": async_get_scheduler(hass).rate,
+        "command_timeouts": dict(coordinator.command_timeouts.most_common()),
+        "verification_stragglers": dict(stragglers.most_common()),
+        "verification_passes": [verification._asdict() for verification in passes],
+    }
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+
+from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -12,12 +15,40 @@ from .coordinator import ZoneLightingCoordinator
 class ZoneLightingEntity(CoordinatorEntity):
     """ZoneLightingEntity class."""
 
-    def __init__(self, coordinator: ZoneLightingCoordinator) -> None:
-        """Initialize."""
-        super().__init__(coordinator)
+    _state_fingerprint: tuple | None = None
+
+    def __init__(
+        self,
+        coordinator: ZoneLightingCoordinator,
+        topics: Iterable[str] = (),
+    ) -> None:
+        """Initialize, subscribing to the coordinator topics this entity renders."""
+        super().__init__(coordinator, context=frozenset(topics))
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, coordinator.config_entry.entry_id)},
             model=DEVICE_VERSION,
             name=coordinator.zone_name,
             manufacturer=NAME,
         )
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state, forgetting what the last change check rendered."""
+        self._state_fingerprint = None
+        super().async_write_ha_state()
+
+    @callback
+    def async_write_ha_state_if_changed(self) -> None:
+        """Write the state only if it renders differently from the last write."""
+        fingerprint = (
+            self.available,
+            self.state,
+            self.capability_attributes,
+            self.state_attributes,
+            self.extra_state_attributes,
+            self.supported_features,
+        )
+        if fingerprint == self._state_fingerprint:
+            return
+        self.async_write_ha_state()
+        self._state_fingerprint = fingerprint
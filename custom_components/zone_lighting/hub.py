@@ -0,0 +1,167 @@
+"""Member light tracking shared by all Zone Lighting zones."""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING
+
+from homeassistant.const import STATE_ON
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .const import DOMAIN, HUB
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant
+
+
+@callback
+def async_get_hub(hass: HomeAssistant) -> ZoneLightingHub:
+    """Return the hub shared by all zones, creating it on first use."""
+    data = hass.data.setdefault(DOMAIN, {})
+    if (hub := data.get(HUB)) is None:
+        hub = data[HUB] = ZoneLightingHub(hass)
+    return hub
+
+
+class ZoneLightingHub:
+    """
+    Track each member light once, however many zones include it.
+
+    Keeps an index from light to zones so a state change is only dispatched to
+    the zones containing that light, and counts of on lights per zone so
+    cross-zone questions don't need to look at every member.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._zones_by_light: dict[str, set[str]] = {}
+        self._zone_lights: dict[str, set[str]] = {}
+        self._zone_callbacks: dict[str, Callable[[Event], None]] = {}
+        self._unsub_lights: dict[str, CALLBACK_TYPE] = {}
+        self._on_lights: set[str] = set()
+        self._zone_on_counts: dict[str, int] = {}
+        self._fully_on: set[str] = set()
+        self._scene_owners: dict[str, str] = {}
+
+    @callback
+    def async_add_zone(
+        self,
+        zone_id: str,
+        entity_ids: Iterable[str],
+        on_member_changed: Callable[[Event], None],
+    ) -> CALLBACK_TYPE:
+        """Start dispatching member state changes to a zone, returns a remover."""
+        self._zone_callbacks[zone_id] = on_member_changed
+        self._zone_lights[zone_id] = set()
+        self._zone_on_counts[zone_id] = 0
+        self.async_set_zone_lights(zone_id, entity_ids)
+        return partial(self._async_remove_zone, zone_id)
+
+    @callback
+    def async_set_zone_lights(self, zone_id: str, entity_ids: Iterable[str]) -> None:
+        """Replace the lights of a zone, tracking only lights new to the hub."""
+        lights = set(entity_ids)
+        current = self._zone_lights[zone_id]
+        for entity_id in current - lights:
+            self._async_unlink(zone_id, entity_id)
+        for entity_id in lights - current:
+            self._async_link(zone_id, entity_id)
+        self._async_update_fully_on(zone_id)
+
+    @callback
+    def _async_remove_zone(self, zone_id: str) -> None:
+        for entity_id in tuple(self._zone_lights[zone_id]):
+            self._async_unlink(zone_id, entity_id)
+        del self._zone_lights[zone_id]
+        del self._zone_callbacks[zone_id]
+        del self._zone_on_counts[zone_id]
+        self._fully_on.discard(zone_id)
+
+    @callback
+    def _async_link(self, zone_id: str, entity_id: str) -> None:
+        if (zones := self._zones_by_light.get(entity_id)) is None:
+            zones = self._zones_by_light[entity_id] = set()
+            self._unsub_lights[entity_id] = async_track_state_change_event(
+                self.hass, entity_id, self._async_light_changed
+            )
+            state = self.hass.states.get(entity_id)
+            if state is not None and state.state == STATE_ON:
+                self._on_lights.add(entity_id)
+
+        zones.add(zone_id)
+        self._zone_lights[zone_id].add(entity_id)
+        if entity_id in self._on_lights:
+            self._zone_on_counts[zone_id] += 1
+
+    @callback
+    def _async_unlink(self, zone_id: str, entity_id: str) -> None:
+        self._zone_lights[zone_id].discard(entity_id)
+        if entity_id in self._on_lights:
+            self._zone_on_counts[zone_id] -= 1
+        if self._scene_owners.get(entity_id) == zone_id:
+            del self._scene_owners[entity_id]
+
+        zones = self._zones_by_light[entity_id]
+        zones.discard(zone_id)
+        if zones:
+            return
+        del self._zones_by_light[entity_id]
+        self._unsub_lights.pop(entity_id)()
+        self._on_lights.discard(entity_id)
+
+    @callback
+    def _async_update_fully_on(self, zone_id: str) -> None:
+        lights = self._zone_lights[zone_id]
+        if lights and self._zone_on_counts[zone_id] == len(lights):
+            self._fully_on.add(zone_id)
+        else:
+            self._fully_on.discard(zone_id)
+
+    @callback
+    def _async_light_changed(self, event: Event) -> None:
+        entity_id = event.data["entity_id"]
+        if not (zones := self._zones_by_light.get(entity_id)):
+            return
+
+        new_state = event.data["new_state"]
+        is_on = new_state is not None and new_state.state == STATE_ON
+        if is_on != (entity_id in self._on_lights):
+            if is_on:
+                self._on_lights.add(entity_id)
+            else:
+                self._on_lights.discard(entity_id)
+            for zone_id in zones:
+                self._zone_on_counts[zone_id] += 1 if is_on else -1
+                self._async_update_fully_on(zone_id)
+
+        # A zone may change its lights while handling the event
+        for zone_id in tuple(zones):
+            if callback_ := self._zone_callbacks.get(zone_id):
+                callback_(event)
+
+    @callback
+    def async_set_scene_owner(self, zone_id: str, entity_ids: Iterable[str]) -> None:
+        """Record the zone whose scene last commanded these lights."""
+        for entity_id in entity_ids:
+            if entity_id in self._zones_by_light:
+                self._scene_owners[entity_id] = zone_id
+
+    def scene_owner(self, entity_id: str) -> str | None:
+        """Return the zone whose scene last commanded a light."""
+        return self._scene_owners.get(entity_id)
+
+    def zones_for_light(self, entity_id: str) -> frozenset[str]:
+        """Return the zones that include a light."""
+        return frozenset(self._zones_by_light.get(entity_id, ()))
+
+    def zone_fully_on(self, zone_id: str) -> bool:
+        """Return whether every light of a zone is on."""
+        return zone_id in self._fully_on
+
+    @property
+    def fully_on_zones(self) -> frozenset[str]:
+        """Return the zones with every light on."""
+        return frozenset(self._fully_on)
@@ -2,50 +2,63 @@
 
 from __future__ import annotations
 
+import heapq
 import logging
-import re
+from fractions import Fraction
 from typing import Any
 
-from homeassistant.components import light
-from homeassistant.components.group.light import LightGroup
+from homeassistant.components.group.light import SUPPORT_GROUP_LIGHT, LightGroup
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
+    ATTR_COLOR_MODE,
     ATTR_COLOR_TEMP_KELVIN,
     ATTR_EFFECT,
     ATTR_FLASH,
     ATTR_HS_COLOR,
+    ATTR_MAX_COLOR_TEMP_KELVIN,
+    ATTR_MIN_COLOR_TEMP_KELVIN,
     ATTR_RGB_COLOR,
     ATTR_RGBW_COLOR,
     ATTR_RGBWW_COLOR,
+    ATTR_SUPPORTED_COLOR_MODES,
     ATTR_TRANSITION,
     ATTR_WHITE,
     ATTR_XY_COLOR,
     ColorMode,
     LightEntityFeature,
+    filter_supported_color_modes,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     ATTR_ENTITY_ID,
+    ATTR_SUPPORTED_FEATURES,
+    SERVICE_TURN_OFF,
     SERVICE_TURN_ON,
     STATE_ON,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 
+from .commands import CoalescingCommandQueue
 from .const import (
     MANUAL,
 )
 from .coordinator import (
     MODEL_CONTROLLER,
+    MODEL_LIGHTS,
+    MODEL_OPTIONS,
     MODEL_SCENE,
     MODEL_STATE,
     ZoneLightingCoordinator,
 )
 from .entity import ZoneLightingEntity
+from .hub import async_get_hub
+from .model import ZoneSnapshot
 from .util import (
     get_coordinator,
-    initialize_with_config,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -56,7 +69,6 @@ async def async_setup_entry(
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    config_data = await initialize_with_config(hass, config_entry)
     coordinator = get_coordinator(hass, config_entry)
 
     async_add_entities(
@@ -85,16 +97,340 @@ FORWARDED_ATTRIBUTES = frozenset(
     }
 )
 
+# Color attributes averaged per component with mean_tuple
+MEAN_TUPLE_ATTRIBUTES = (
+    ATTR_HS_COLOR,
+    ATTR_RGB_COLOR,
+    ATTR_RGBW_COLOR,
+    ATTR_RGBWW_COLOR,
+    ATTR_XY_COLOR,
+)
+
 SCENE_PREFIX = "Scene"
 CONTROL_PREFIX = "Control"
+EFFECT_PREFIXES = ((MODEL_SCENE, SCENE_PREFIX), (MODEL_CONTROLLER, CONTROL_PREFIX))
+SELECTED_SUFFIX = " ✅"
+
+
+def build_effects(
+    data: ZoneSnapshot,
+) -> tuple[list[str], dict[str, tuple[str, str]]]:
+    """
+    Build the effect list for the zone's scenes and controllers.
+
+    Also returns a lookup from every effect name, with or without the selected
+    marker, to its model type and value.
+    """
+    effect_list = []
+    effect_lookup = {}
+    for type, prefix in EFFECT_PREFIXES:
+        list_state = data.get_list(type)
+        for value in list_state.values:
+            effect = f"{prefix}: {value}"
+            selected = f"{effect}{SELECTED_SUFFIX}"
+            effect_lookup[effect] = effect_lookup[selected] = (type, value)
+            effect_list.append(selected if value == list_state.current else effect)
+    return effect_list, effect_lookup
+
+
+class MemberStateIndex:
+    """Live index of which member lights are on, unknown or unavailable."""
+
+    def __init__(self) -> None:
+        self.states: dict[str, State] = {}
+        self.on: dict[str, None] = {}
+        self.unavailable: set[str] = set()
+        self.invalid: set[str] = set()
+
+    def update(self, entity_id: str, state: State | None) -> None:
+        self.on.pop(entity_id, None)
+        self.unavailable.discard(entity_id)
+        self.invalid.discard(entity_id)
+        if state is None:
+            self.states.pop(entity_id, None)
+            return
+
+        self.states[entity_id] = state
+        if state.state == STATE_ON:
+            self.on[entity_id] = None
+        elif state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+            self.invalid.add(entity_id)
+            if state.state == STATE_UNAVAILABLE:
+                self.unavailable.add(entity_id)
+
+    @property
+    def is_on(self) -> bool | None:
+        """On if any member is on, None if no member has a known state."""
+        if len(self.invalid) == len(self.states):
+            return None
+        return bool(self.on)
 
+    @property
+    def available(self) -> bool:
+        return len(self.unavailable) < len(self.states)
 
-def add_prefix(prefix: str):
-    return lambda val: f"{prefix}: {val}"
 
+class _RunningMean:
+    """Mean of member values, updated one member at a time."""
 
-def show_selected(current_val: str):
-    return lambda val: f"{val} ✅" if val == current_val else val
+    def __init__(self) -> None:
+        self._values: dict[str, Any] = {}
+        self._total: Any = None
+
+    def set(self, entity_id: str, value: Any) -> None:
+        self.discard(entity_id)
+        if value is None:
+            return
+        self._values[entity_id] = value
+        if isinstance(value, tuple | list):
+            parts = [Fraction(part) for part in value]
+            self._total = (
+                parts
+                if self._total is None
+                else [total + part for total, part in zip(self._total, parts)]
+            )
+        else:
+            self._total = Fraction(value) + (self._total or 0)
+
+    def discard(self, entity_id: str) -> None:
+        if (value := self._values.pop(entity_id, None)) is None:
+            return
+        if not self._values:
+            self._total = None
+        elif isinstance(value, tuple | list):
+            self._total = [
+                total - Fraction(part) for total, part in zip(self._total, value)
+            ]
+        else:
+            self._total -= Fraction(value)
+
+    def mean_int(self) -> Any:
+        """Match reduce_attribute with mean_int."""
+        if len(self._values) < 2:
+            return next(iter(self._values.values()), None)
+        return int(self._total / len(self._values))
+
+    def mean_tuple(self) -> Any:
+        """Match reduce_attribute with mean_tuple."""
+        if len(self._values) < 2:
+            return next(iter(self._values.values()), None)
+        return tuple(float(total / len(self._values)) for total in self._total)
+
+
+class _Histogram:
+    """
+    Members grouped by the values they contribute.
+
+    An ordered histogram also tracks the first member contributing each value,
+    in a heap per value whose top is always a current member. Its version
+    changes whenever a value appears, disappears or gets a new first member.
+    """
+
+    def __init__(self, ordered: bool = False) -> None:
+        self._values: dict[str, tuple] = {}
+        self.members: dict[Any, set[str]] = {}
+        self._ordered = ordered
+        self._positions: dict[str, int] = {}
+        self._first: dict[Any, list[tuple[int, str]]] = {}
+        self.version = 0
+
+    def set_order(self, positions: dict[str, int]) -> None:
+        self._positions = positions
+        if self._ordered:
+            self._first = {
+                value: self._build_heap(members)
+                for value, members in self.members.items()
+            }
+            self.version += 1
+
+    def _build_heap(self, members: set[str]) -> list[tuple[int, str]]:
+        heap = [(self._positions.get(entity_id, 0), entity_id) for entity_id in members]
+        heapq.heapify(heap)
+        return heap
+
+    def set(self, entity_id: str, values: Any) -> None:
+        if values is not None:
+            values = (
+                tuple(values) if isinstance(values, set | list | tuple) else (values,)
+            )
+        if values == self._values.get(entity_id):
+            return
+        self.discard(entity_id)
+        if values is None:
+            return
+        self._values[entity_id] = values
+        for value in values:
+            if (members := self.members.get(value)) is None:
+                members = self.members[value] = set()
+                self.version += 1
+            members.add(entity_id)
+            if self._ordered:
+                self._push_first(value, entity_id, members)
+
+    def _push_first(self, value: Any, entity_id: str, members: set[str]) -> None:
+        entry = (self._positions.get(entity_id, 0), entity_id)
+        if (heap := self._first.get(value)) is None:
+            self._first[value] = [entry]
+            return
+        if entry < heap[0]:
+            self.version += 1
+        heapq.heappush(heap, entry)
+        if len(heap) > 2 * len(members) + 8:
+            # Drop the entries of members that left without reaching the top
+            self._first[value] = self._build_heap(members)
+
+    def first(self, value: Any) -> tuple[int, str]:
+        """Return the position and id of the first member contributing a value."""
+        return self._first[value][0]
+
+    def in_member_order(self) -> list:
+        """Return the values in the order a union of the members' values has."""
+
+        def key(value: Any) -> tuple[int, str, int]:
+            position, entity_id = self._first[value][0]
+            return position, entity_id, self._values[entity_id].index(value)
+
+        return sorted(self.members, key=key)
+
+    def discard(self, entity_id: str) -> None:
+        for value in self._values.pop(entity_id, ()):
+            members = self.members[value]
+            members.discard(entity_id)
+            if not members:
+                del self.members[value]
+                self._first.pop(value, None)
+                self.version += 1
+            elif self._ordered and self._first[value][0][1] == entity_id:
+                self._pop_stale(value, members)
+
+    def _pop_stale(self, value: Any, members: set[str]) -> None:
+        heap = self._first[value]
+        while heap[0][1] not in members or (
+            self._positions.get(heap[0][1], 0) != heap[0][0]
+        ):
+            heapq.heappop(heap)
+        self.version += 1
+
+
+class GroupStateAggregator(MemberStateIndex):
+    """
+    Incrementally maintained light group state.
+
+    Produces the same brightness, color, color mode and feature state as
+    LightGroup.async_update_group_state, but each member change only updates
+    that member's contribution. Effects are not aggregated, the zone replaces
+    them with its scenes and controllers.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._brightness = _RunningMean()
+        self._color_temp_kelvin = _RunningMean()
+        self._colors = {attr: _RunningMean() for attr in MEAN_TUPLE_ATTRIBUTES}
+        self._min_color_temp_kelvin = _Histogram()
+        self._max_color_temp_kelvin = _Histogram()
+        self._supported_color_modes = _Histogram(ordered=True)
+        self._supported_features = _Histogram()
+        self._color_modes = _Histogram(ordered=True)
+        self._supported_color_modes_cache: tuple[int, set[ColorMode]] | None = None
+
+    def set_order(self, entity_ids: list[str]) -> None:
+        """Set member order, used to break ties like the group's Counter does."""
+        positions = {entity_id: index for index, entity_id in enumerate(entity_ids)}
+        self._supported_color_modes.set_order(positions)
+        self._color_modes.set_order(positions)
+
+    def update(self, entity_id: str, state: State | None) -> None:
+        super().update(entity_id, state)
+        attributes = state.attributes if state is not None else {}
+        on_attributes = attributes if entity_id in self.on else {}
+
+        self._brightness.set(entity_id, on_attributes.get(ATTR_BRIGHTNESS))
+        self._color_temp_kelvin.set(
+            entity_id, on_attributes.get(ATTR_COLOR_TEMP_KELVIN)
+        )
+        for attr, mean in self._colors.items():
+            mean.set(entity_id, on_attributes.get(attr))
+        self._color_modes.set(entity_id, on_attributes.get(ATTR_COLOR_MODE))
+
+        self._min_color_temp_kelvin.set(
+            entity_id, attributes.get(ATTR_MIN_COLOR_TEMP_KELVIN)
+        )
+        self._max_color_temp_kelvin.set(
+            entity_id, attributes.get(ATTR_MAX_COLOR_TEMP_KELVIN)
+        )
+        self._supported_color_modes.set(
+            entity_id, attributes.get(ATTR_SUPPORTED_COLOR_MODES)
+        )
+        self._supported_features.set(entity_id, attributes.get(ATTR_SUPPORTED_FEATURES))
+
+    def color_mode(self, supported_color_modes: set[ColorMode]) -> ColorMode:
+        color_mode_count = {
+            mode: len(members) for mode, members in self._color_modes.members.items()
+        }
+        if not color_mode_count:
+            return ColorMode.UNKNOWN
+        # Report the most common color mode, select brightness and onoff last
+        if ColorMode.ONOFF in color_mode_count:
+            if ColorMode.ONOFF in supported_color_modes:
+                color_mode_count[ColorMode.ONOFF] = -1
+            else:
+                color_mode_count.pop(ColorMode.ONOFF)
+        if ColorMode.BRIGHTNESS in color_mode_count:
+            if ColorMode.BRIGHTNESS in supported_color_modes:
+                color_mode_count[ColorMode.BRIGHTNESS] = 0
+            else:
+                color_mode_count.pop(ColorMode.BRIGHTNESS)
+        if not color_mode_count:
+            return next(iter(supported_color_modes))
+        return min(
+            color_mode_count,
+            key=lambda mode: (-color_mode_count[mode], self._color_modes.first(mode)),
+        )
+
+    @property
+    def brightness(self) -> Any:
+        return self._brightness.mean_int()
+
+    @property
+    def color_temp_kelvin(self) -> Any:
+        return self._color_temp_kelvin.mean_int()
+
+    def color(self, attr: str) -> Any:
+        return self._colors[attr].mean_tuple()
+
+    @property
+    def min_color_temp_kelvin(self) -> int:
+        if not (values := self._min_color_temp_kelvin.members):
+            return LightGroup._attr_min_color_temp_kelvin
+        return min(values)
+
+    @property
+    def max_color_temp_kelvin(self) -> int:
+        if not (values := self._max_color_temp_kelvin.members):
+            return LightGroup._attr_max_color_temp_kelvin
+        return max(values)
+
+    @property
+    def supported_color_modes(self) -> set[ColorMode]:
+        histogram = self._supported_color_modes
+        if not histogram.members:
+            return {ColorMode.ONOFF}
+        cache = self._supported_color_modes_cache
+        if cache is not None and cache[0] == histogram.version:
+            return cache[1]
+        # Build the set in member order like the group does, its iteration order
+        # picks the color mode when no on member reports a supported one
+        modes = filter_supported_color_modes(set(histogram.in_member_order()))
+        self._supported_color_modes_cache = (histogram.version, modes)
+        return modes
+
+    @property
+    def supported_features(self) -> LightEntityFeature:
+        supported_features = LightEntityFeature(0)
+        for support in self._supported_features.members:
+            supported_features |= support
+        return supported_features & SUPPORT_GROUP_LIGHT
 
 
 class LightZone(ZoneLightingEntity, LightGroup, RestoreEntity):
@@ -107,19 +443,61 @@ class LightZone(ZoneLightingEntity, LightGroup, RestoreEntity):
         coordinator: ZoneLightingCoordinator,
         unique_id: str,
     ) -> None:
-        ZoneLightingEntity.__init__(self, coordinator)
+        ZoneLightingEntity.__init__(
+            self,
+            coordinator,
+            (MODEL_STATE, MODEL_SCENE, MODEL_CONTROLLER, MODEL_LIGHTS, MODEL_OPTIONS),
+        )
         LightGroup.__init__(
             self, unique_id, coordinator.zone_name, coordinator.light_entity_ids, None
         )
+        self._member_ids = set(self._entity_ids)
+        self._members = GroupStateAggregator()
+        self._members.set_order(self._entity_ids)
+        self._unsub_hub: CALLBACK_TYPE | None = None
+        self._command_queue: CoalescingCommandQueue | None = None
+        self._effects_key = None
+        self._syncing_on_state = False
+        self._effect_list: list[str] = []
+        self._effect_lookup: dict[str, tuple[str, str]] = {}
 
     @property
     def is_manual(self):
         if not self.coordinator.data:
             return False
-        return self.coordinator.data[MODEL_SCENE]["current"] == MANUAL
+        return self.coordinator.data.scene.current == MANUAL
 
     async def async_added_to_hass(self) -> None:
-        await super().async_added_to_hass()
+        # The group renders right away when Home Assistant is already running,
+        # so the index has to hold the members' current states first
+        for entity_id in self._entity_ids:
+            self._members.update(entity_id, self.hass.states.get(entity_id))
+
+        # Member state changes come from the shared hub instead of a tracker
+        # per zone, so the group listener is set up without any entity ids
+        entity_ids, self._entity_ids = self._entity_ids, []
+        try:
+            await super().async_added_to_hass()
+        finally:
+            self._entity_ids = entity_ids
+
+        self._unsub_hub = async_get_hub(self.hass).async_add_zone(
+            self.coordinator.config_entry.entry_id,
+            self._entity_ids,
+            self._async_member_changed,
+        )
+
+        self._command_queue = CoalescingCommandQueue(
+            self.hass,
+            self.coordinator.zone_name,
+            self._async_forward_turn_on,
+            self.coordinator.command_interval,
+        )
+
+        if self.coordinator.restored:
+            if self.coordinator.data.on:
+                self.coordinator.async_set_on_state(True)
+            return
 
         last_state = await self.async_get_last_state()
         _LOGGER.debug("%s: last state is %s", self.name, last_state)
@@ -130,21 +508,25 @@ class LightZone(ZoneLightingEntity, LightGroup, RestoreEntity):
         effect = None
         effect_type = None
         if ATTR_EFFECT in kwargs:
-            pattern = r"^(.*?): "
-            type_match = re.match(pattern, kwargs[ATTR_EFFECT])
-            if type_match:
-                effect = re.sub(pattern, "", kwargs[ATTR_EFFECT])
-                if type_match.group(1) == SCENE_PREFIX:
-                    effect_type = MODEL_SCENE
-                elif type_match.group(1) == CONTROL_PREFIX:
-                    effect_type = MODEL_CONTROLLER
-
-        if effect_type and effect:
-            self.coordinator.async_set_current_list_val(effect_type, effect)
+            self._async_update_effects()
+            effect_type, effect = self._effect_lookup.get(
+                kwargs[ATTR_EFFECT], (None, None)
+            )
 
-        self.coordinator.async_set_on_state(True)
+        was_on = self.coordinator.data.on
+        manual = self.is_manual
+        if effect_type == MODEL_SCENE and effect:
+            manual = effect == MANUAL
+        with self.coordinator.async_batch():
+            if effect_type and effect:
+                self.coordinator.async_set_current_list_val(effect_type, effect)
+            self.coordinator.async_set_on_state(True)
+            # Activating a scene updates child zones, a manual zone only turns
+            # all its lights on when it was off
+            if manual and not was_on:
+                self.coordinator.async_update_child_zones()
 
-        if self.is_manual or (effect_type == SCENE_PREFIX and effect == MANUAL):
+        if manual:
             await self.async_proxy_turn_on(**kwargs)
             return
 
@@ -153,76 +535,152 @@ class LightZone(ZoneLightingEntity, LightGroup, RestoreEntity):
         data = {
             key: value for key, value in kwargs.items() if key in FORWARDED_ATTRIBUTES
         }
+        await self._command_queue.async_send(data)
+
+    async def _async_forward_turn_on(self, data: dict[str, Any]) -> None:
+        """Send a coalesced turn_on command, targeting lights when it is sent."""
+        data = dict(data)
         if self.state == STATE_ON:
-            on_ids = [
-                entity_id
-                for entity_id in self._entity_ids
-                if (state := self.hass.states.get(entity_id)) is not None
-                and state.state == STATE_ON
-            ]
-            data[ATTR_ENTITY_ID] = on_ids
+            data[ATTR_ENTITY_ID] = list(self._members.on)
         else:
             data[ATTR_ENTITY_ID] = self._entity_ids
 
         _LOGGER.debug("Forwarded turn_on command: %s", data)
 
-        await self.hass.services.async_call(
-            light.DOMAIN,
-            SERVICE_TURN_ON,
-            data,
-            blocking=True,
-            context=self._context,
-        )
+        await self.coordinator.async_call_light(SERVICE_TURN_ON, data, self._context)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        self.coordinator.async_set_on_state(False)
-        await LightGroup.async_turn_off(self, **kwargs)
+        if self._command_queue:
+            # A queued turn_on would pick its targets after the zone is off
+            self._command_queue.async_discard()
+        with self.coordinator.async_batch():
+            self.coordinator.async_set_on_state(False)
+            self.coordinator.async_update_child_zones()
+        data = {ATTR_ENTITY_ID: self._entity_ids}
+        if ATTR_TRANSITION in kwargs:
+            data[ATTR_TRANSITION] = kwargs[ATTR_TRANSITION]
+        await self.coordinator.async_call_light(SERVICE_TURN_OFF, data, self._context)
         # if self.is_manual:
         # return
 
         # self.async_update_group_state()
         # self.async_schedule_update_ha_state()
 
+    @callback
+    def _async_update_members(self) -> None:
+        """Follow member lights renamed in the entity registry."""
+        entity_ids = self.coordinator.light_entity_ids
+        if entity_ids == self._entity_ids:
+            return
+        self._entity_ids = entity_ids
+        self._attr_extra_state_attributes = {ATTR_ENTITY_ID: entity_ids}
+
+        member_ids = set(entity_ids)
+        for entity_id in self._member_ids - member_ids:
+            self._members.update(entity_id, None)
+        for entity_id in member_ids - self._member_ids:
+            self._members.update(entity_id, self.hass.states.get(entity_id))
+        self._member_ids = member_ids
+        self._members.set_order(entity_ids)
+
+        if self._unsub_hub:
+            async_get_hub(self.hass).async_set_zone_lights(
+                self.coordinator.config_entry.entry_id, entity_ids
+            )
+
+    @callback
+    def _async_member_changed(self, event: Event) -> None:
+        self.async_set_context(event.context)
+        self.async_update_supported_features(
+            event.data["entity_id"], event.data["new_state"]
+        )
+        self.async_defer_or_update_ha_state()
+
+    @callback
+    def async_defer_or_update_ha_state(self) -> None:
+        """Only update once at start, and only when the rendered state changes."""
+        if not self.hass.is_running:
+            return
+        self.async_update_group_state()
+        self.async_write_ha_state_if_changed()
+
+    async def async_will_remove_from_hass(self) -> None:
+        await super().async_will_remove_from_hass()
+        if self._command_queue:
+            self._command_queue.async_cancel()
+        if self._unsub_hub:
+            self._unsub_hub()
+            self._unsub_hub = None
+
+    @callback
+    def async_update_supported_features(
+        self, entity_id: str, new_state: State | None
+    ) -> None:
+        """Keep the member index current, called by the group for member changes."""
+        if entity_id in self._member_ids:
+            self._members.update(entity_id, new_state)
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        if self._syncing_on_state:
+            # Caused by the group state update that is already rendering it
+            return
+        if self._command_queue:
+            self._command_queue.min_interval = self.coordinator.command_interval
+        self._async_update_members()
         self.async_update_group_state()
-        self.schedule_update_ha_state()
+        self.async_write_ha_state_if_changed()
+
+    @callback
+    def _async_update_effects(self) -> None:
+        """Rebuild the effect list and lookup only when the lists change."""
+        if not (data := self.coordinator.data):
+            return
+        key = (data.version(MODEL_SCENE), data.version(MODEL_CONTROLLER))
+        if key == self._effects_key:
+            return
+        self._effects_key = key
+        self._effect_list, self._effect_lookup = build_effects(data)
+
+    @callback
+    def _async_apply_aggregated_state(self) -> None:
+        members = self._members
+        self._attr_is_on = members.is_on
+        self._attr_available = members.available
+        self._attr_brightness = members.brightness
+        self._attr_color_temp_kelvin = members.color_temp_kelvin
+        self._attr_hs_color = members.color(ATTR_HS_COLOR)
+        self._attr_rgb_color = members.color(ATTR_RGB_COLOR)
+        self._attr_rgbw_color = members.color(ATTR_RGBW_COLOR)
+        self._attr_rgbww_color = members.color(ATTR_RGBWW_COLOR)
+        self._attr_xy_color = members.color(ATTR_XY_COLOR)
+        self._attr_min_color_temp_kelvin = members.min_color_temp_kelvin
+        self._attr_max_color_temp_kelvin = members.max_color_temp_kelvin
+        self._attr_supported_color_modes = members.supported_color_modes
+        self._attr_color_mode = members.color_mode(self._attr_supported_color_modes)
+        self._attr_supported_features = members.supported_features
 
     @callback
     def async_update_group_state(self) -> None:
-        LightGroup.async_update_group_state(self)
+        self._async_apply_aggregated_state()
         self._attr_supported_features |= LightEntityFeature.EFFECT
 
         if not self.coordinator.data:
             return
 
-        scene_model = self.coordinator.data[MODEL_SCENE]
-        scenes = list(
-            map(
-                add_prefix(SCENE_PREFIX),
-                map(show_selected(scene_model["current"]), scene_model["values"]),
-            )
-        )
-
-        controller_model = self.coordinator.data[MODEL_CONTROLLER]
-        controllers = list(
-            map(
-                add_prefix(CONTROL_PREFIX),
-                map(
-                    show_selected(controller_model["current"]),
-                    controller_model["values"],
-                ),
-            )
-        )
-
-        self._attr_effect_list = scenes + controllers
+        self._async_update_effects()
+        self._attr_effect_list = self._effect_list
         self._attr_effect = None
 
         if self.is_manual:
-            if self.coordinator.data[MODEL_STATE] != self._attr_is_on:
-                self.coordinator.async_set_on_state(self._attr_is_on)
+            if self.coordinator.data.on != self._attr_is_on:
+                self._syncing_on_state = True
+                try:
+                    self.coordinator.async_set_on_state(self._attr_is_on)
+                finally:
+                    self._syncing_on_state = False
             return
 
-        self._attr_is_on = self.coordinator.data[MODEL_STATE]
+        self._attr_is_on = self.coordinator.data.on
         self._attr_supported_color_modes = {ColorMode.ONOFF}
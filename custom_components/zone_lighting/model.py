@@ -0,0 +1,178 @@
+"""Runtime model of a Zone Lighting zone."""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .snapshot import SceneSummary, summarize_scene_states
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+    from datetime import datetime
+
+MODEL_SCENE = "scene"
+MODEL_CONTROLLER = "controller"
+MODEL_STATE = "on_state"
+MODEL_SCENE_STATES = "scene_states"
+MODEL_LIGHTS = "lights"
+MODEL_OPTIONS = "options"
+
+
+class ListState(NamedTuple):
+    """The values of a selectable list with its current and previous value."""
+
+    values: tuple[str, ...]
+    options: frozenset[str]
+    current: str | None = None
+    previous: str | None = None
+
+    @classmethod
+    def create(cls, values: Iterable[str]) -> ListState:
+        values = tuple(values)
+        return cls(values, frozenset(values))
+
+    def is_option(self, value: str | None) -> bool:
+        return value in self.options
+
+    def with_values(self, values: Iterable[str]) -> ListState:
+        """Replace the values, dropping a previous value that's no longer one."""
+        values = tuple(values)
+        options = frozenset(values)
+        return self._replace(
+            values=values,
+            options=options,
+            previous=self.previous if self.previous in options else None,
+        )
+
+    def with_current(self, value: str | None) -> ListState:
+        """Select a value, remembering the current one as previous."""
+        return self._replace(current=value, previous=self.current)
+
+
+class ZoneSnapshot(NamedTuple):
+    """Immutable view of a zone's model, as published to entities."""
+
+    on: bool
+    scene: ListState
+    controller: ListState
+    scene_states: Mapping[str, Mapping[str, Any]]
+    scene_summaries: Mapping[str, SceneSummary]
+    versions: Mapping[str, int]
+
+    def get_list(self, type: str) -> ListState:
+        return self.scene if type == MODEL_SCENE else self.controller
+
+    def version(self, topic: str) -> int:
+        """Return the version of a topic, which only increases when it changes."""
+        return self.versions.get(topic, 0)
+
+
+class ZoneModel:
+    """
+    Mutable model of a zone, published as immutable snapshots.
+
+    Sections are replaced rather than changed in place, so a snapshot is a few
+    references shared with the model and with other snapshots. Every published
+    topic has a version, letting entities skip work when nothing they render
+    has changed.
+    """
+
+    __slots__ = (
+        "on",
+        "scene",
+        "controller",
+        "_scene_states",
+        "_scene_summaries",
+        "_versions",
+    )
+
+    def __init__(self, scenes: Iterable[str], controllers: Iterable[str]) -> None:
+        self.on = False
+        self.scene = ListState.create(scenes)
+        self.controller = ListState.create(controllers)
+        self._scene_states: dict[str, dict[str, Any]] = {}
+        self._scene_summaries: dict[str, SceneSummary] = {}
+        self._versions: dict[str, int] = {}
+
+    def get_list(self, type: str) -> ListState:
+        return self.scene if type == MODEL_SCENE else self.controller
+
+    def set_list(self, type: str, state: ListState) -> None:
+        if type == MODEL_SCENE:
+            self.scene = state
+        else:
+            self.controller = state
+
+    @property
+    def scene_states(self) -> Mapping[str, dict[str, Any]]:
+        return self._scene_states
+
+    @property
+    def scene_summaries(self) -> Mapping[str, SceneSummary]:
+        return self._scene_summaries
+
+    def load_scene_states(
+        self,
+        scene_states: dict[str, dict[str, Any]],
+        saved_at: Mapping[str, datetime | None],
+    ) -> None:
+        self._scene_states = scene_states
+        self._scene_summaries = {
+            scene: summarize_scene_states(states, saved_at.get(scene))
+            for scene, states in scene_states.items()
+        }
+
+    def set_scene_states(
+        self, scene: str, states: dict[str, Any], saved_at: datetime | None
+    ) -> None:
+        self._scene_states = {**self._scene_states, scene: states}
+        self._scene_summaries = {
+            **self._scene_summaries,
+            scene: summarize_scene_states(states, saved_at),
+        }
+
+    def remove_scene_states(self, scene: str) -> None:
+        self._scene_states = {
+            key: states for key, states in self._scene_states.items() if key != scene
+        }
+        self._scene_summaries = {
+            key: summary
+            for key, summary in self._scene_summaries.items()
+            if key != scene
+        }
+
+    def rename_light(self, old_entity_id: str, new_entity_id: str) -> list[str]:
+        """Move a light's saved states to its new id, returning the scenes changed."""
+        scenes = [
+            scene
+            for scene, states in self._scene_states.items()
+            if old_entity_id in states
+        ]
+        for scene in scenes:
+            states = {
+                new_entity_id if entity_id == old_entity_id else entity_id: state
+                for entity_id, state in self._scene_states[scene].items()
+            }
+            self.set_scene_states(scene, states, self._scene_summaries[scene].saved_at)
+        return scenes
+
+    def version(self, topic: str) -> int:
+        return self._versions.get(topic, 0)
+
+    def bump(self, topics: Iterable[str]) -> None:
+        """Increase the version of each changed topic."""
+        versions = dict(self._versions)
+        for topic in topics:
+            versions[topic] = versions.get(topic, 0) + 1
+        self._versions = versions
+
+    def snapshot(self) -> ZoneSnapshot:
+        return ZoneSnapshot(
+            self.on,
+            self.scene,
+            self.controller,
+            MappingProxyType(self._scene_states),
+            MappingProxyType(self._scene_summaries),
+            MappingProxyType(self._versions),
+        )
@@ -9,13 +9,21 @@ from typing import TYPE_CHECKING, Any
 from homeassistant.components.scene import Scene
 from homeassistant.core import (
     HomeAssistant,
+    ServiceResponse,
+    SupportsResponse,
     callback,
 )
+from homeassistant.helpers import entity_platform
+from homeassistant.helpers import entity_registry as er
 
 from .const import (
     ATTR_ENTITIES,
+    ATTR_LIGHT_COUNT,
+    ATTR_SAVED_AT,
+    ATTR_SNAPSHOT_HASH,
+    SERVICE_GET_SNAPSHOT,
 )
-from .coordinator import MODEL_SCENE, ZoneLightingCoordinator
+from .coordinator import MODEL_SCENE, ZoneLightingCoordinator, scene_states_topic
 from .entity import ZoneLightingEntity
 from .util import get_coordinator, get_scene_unique_id
 
@@ -32,19 +40,53 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ):
     coordinator = get_coordinator(hass, config_entry)
+    entities: dict[str, ZoneLightingScene] = {}
+
+    def create_entities(scenes):
+        new_entities = []
+        for scene in scenes:
+            entity = ZoneLightingScene(
+                coordinator=coordinator,
+                unique_id=get_scene_unique_id(config_entry.entry_id, scene),
+                name=scene,
+                icon="mdi:image",
+            )
+            entities[scene] = entity
+            new_entities.append(entity)
+        return new_entities
 
-    entities = []
-
-    for scene in coordinator.simple_scenes:
-        entity = ZoneLightingScene(
-            coordinator=coordinator,
-            unique_id=get_scene_unique_id(config_entry.entry_id, scene),
-            name=scene,
-            icon="mdi:image",
-        )
-        entities = entities + [entity]
-
-    async_add_entities(entities, update_before_add=True)
+    @callback
+    def async_update_scenes() -> None:
+        """Add and remove scene entities when the zone's scenes change."""
+        scenes = coordinator.simple_scenes
+        registry = er.async_get(hass)
+        for scene in entities.keys() - set(scenes):
+            entity = entities.pop(scene)
+            if entity.entity_id and registry.async_get(entity.entity_id):
+                registry.async_remove(entity.entity_id)
+            else:
+                hass.async_create_task(entity.async_remove())
+
+        if new_entities := create_entities(
+            [scene for scene in scenes if scene not in entities]
+        ):
+            async_add_entities(new_entities)
+
+    async_add_entities(
+        create_entities(coordinator.simple_scenes), update_before_add=True
+    )
+    config_entry.async_on_unload(
+        coordinator.async_add_listener(async_update_scenes, frozenset({MODEL_SCENE}))
+    )
+
+    platform = entity_platform.async_get_current_platform()
+
+    platform.async_register_entity_service(
+        SERVICE_GET_SNAPSHOT,
+        dict(),
+        "async_get_snapshot",
+        supports_response=SupportsResponse.ONLY,
+    )
 
 
 class ZoneLightingScene(ZoneLightingEntity, Scene):
@@ -59,7 +101,7 @@ class ZoneLightingScene(ZoneLightingEntity, Scene):
         name: str,
         icon: str,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, (scene_states_topic(name),))
         self._attr_unique_id = unique_id
         self._attr_name = f"{coordinator.zone_name} {name}"
         self._attr_icon = icon
@@ -69,26 +111,21 @@ class ZoneLightingScene(ZoneLightingEntity, Scene):
 
     async def async_activate(self, **kwargs: Any) -> None:
         """Activate scene"""
-        entities = self._entity_states
-        if not entities:
+        if not self._entity_states:
             return
-        task = self.hass.async_add_job(self._async_call_apply)
-        if task:
-            await task
-        self.coordinator.async_set_current_list_val(MODEL_SCENE, self._scene)
-
-    async def _async_call_apply(self):
-        await self.hass.services.async_call(
-            "scene", "apply", dict(entities=self._entity_states)
-        )
+        await self.coordinator.async_restore_scene(self._scene, self._context)
 
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
-        last_state = await self.async_get_last_state()
+        if self.coordinator.restored:
+            return
 
-        if ATTR_ENTITIES in last_state.attributes:
+        last_state = await self.async_get_last_state()
+        if last_state is not None and ATTR_ENTITIES in last_state.attributes:
             self.coordinator.async_set_scene_states(
-                self._scene, last_state.attributes[ATTR_ENTITIES]
+                self._scene,
+                last_state.attributes[ATTR_ENTITIES],
+                last_state.last_updated,
             )
 
     @property
@@ -98,13 +135,25 @@ class ZoneLightingScene(ZoneLightingEntity, Scene):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self.schedule_update_ha_state()
+        self.async_write_ha_state_if_changed()
+
+    async def async_get_snapshot(self) -> ServiceResponse:
+        """Return the saved light states, kept out of the state attributes."""
+        summary = self.coordinator.get_scene_summary(self._scene)
+        return {
+            ATTR_ENTITIES: dict(self._entity_states or {}),
+            ATTR_SAVED_AT: summary.saved_at.isoformat()
+            if summary and summary.saved_at
+            else None,
+        }
 
     @property
     def extra_state_attributes(self) -> Mapping[str, Any] | None:
-        """Return entity specific state attributes."""
-        if not self._entity_states:
+        """Return a summary of the snapshot, get_snapshot returns the states."""
+        if not (summary := self.coordinator.get_scene_summary(self._scene)):
             return None
         return {
-            ATTR_ENTITIES: self._entity_states,
+            ATTR_LIGHT_COUNT: summary.light_count,
+            ATTR_SNAPSHOT_HASH: summary.digest,
+            ATTR_SAVED_AT: summary.saved_at,
         }
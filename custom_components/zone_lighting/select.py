@@ -74,7 +74,7 @@ class ZoneLightingSelect(ZoneLightingEntity, SelectEntity, RestoreEntity):
         icon: str,
         type: str,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, (type,))
         self._attr_unique_id = unique_id
         self._attr_name = f"Zone Lighting: {name}"
         self._attr_icon = icon
@@ -82,31 +82,46 @@ class ZoneLightingSelect(ZoneLightingEntity, SelectEntity, RestoreEntity):
         self._attr_options = []
         self._attr_current_option = None
         self._attr_previous_option = None
+        self._version: int | None = None
 
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
+        if self.coordinator.restored:
+            self._update_from_coordinator()
+            self.async_write_ha_state()
+            return
+
         last_state = await self.async_get_last_state()
         if last_state is None:
             self.async_schedule_update_ha_state()
             return
 
-        self.coordinator.async_set_current_list_val(self._list_type, last_state.state)
-        if ATTR_PREVIOUS_STATE in last_state.attributes:
-            previous = last_state.attributes[ATTR_PREVIOUS_STATE]
-            if previous in self._attr_options:
-                self.coordinator.async_set_previous_list_val(self._list_type, previous)
+        with self.coordinator.async_batch():
+            self.coordinator.async_set_current_list_val(
+                self._list_type, last_state.state
+            )
+            if ATTR_PREVIOUS_STATE in last_state.attributes:
+                previous = last_state.attributes[ATTR_PREVIOUS_STATE]
+                if previous in self._attr_options:
+                    self.coordinator.async_set_previous_list_val(
+                        self._list_type, previous
+                    )
 
     def _update_from_coordinator(self):
-        list_data = self.coordinator.data[self._list_type]
-        self._attr_options = list_data["values"]
-        self._attr_current_option = list_data["current"]
-        self._attr_previous_option = list_data["previous"]
+        data = self.coordinator.data
+        if (version := data.version(self._list_type)) == self._version:
+            return
+        self._version = version
+        list_state = data.get_list(self._list_type)
+        self._attr_options = list(list_state.values)
+        self._attr_current_option = list_state.current
+        self._attr_previous_option = list_state.previous
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         self._update_from_coordinator()
-        self.schedule_update_ha_state()
+        self.async_write_ha_state_if_changed()
 
     async def async_select_option(self, option: str) -> None:
         self.coordinator.async_set_current_list_val(self._list_type, option)
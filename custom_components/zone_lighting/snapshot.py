@@ -0,0 +1,258 @@
+"""Compact light snapshots for Zone Lighting scenes."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from homeassistant.components.light import (
+    ATTR_BRIGHTNESS,
+    ATTR_COLOR_MODE,
+    ATTR_COLOR_TEMP_KELVIN,
+    ATTR_HS_COLOR,
+    ATTR_RGB_COLOR,
+    ATTR_RGBW_COLOR,
+    ATTR_RGBWW_COLOR,
+    ATTR_WHITE,
+    ATTR_XY_COLOR,
+    ColorMode,
+)
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    ATTR_STATE,
+    SERVICE_TURN_OFF,
+    SERVICE_TURN_ON,
+    STATE_OFF,
+    STATE_ON,
+)
+from homeassistant.util import color as color_util
+
+from .const import CALL_ORDER_LARGEST_FIRST
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from datetime import datetime
+
+    from homeassistant.core import HomeAssistant, State
+
+# The single attribute that reproduces a light in each color mode, brightness
+# is stored separately for every mode that isn't on/off only.
+COLOR_MODE_ATTRIBUTES = {
+    ColorMode.COLOR_TEMP: ATTR_COLOR_TEMP_KELVIN,
+    ColorMode.HS: ATTR_HS_COLOR,
+    ColorMode.RGB: ATTR_RGB_COLOR,
+    ColorMode.RGBW: ATTR_RGBW_COLOR,
+    ColorMode.RGBWW: ATTR_RGBWW_COLOR,
+    ColorMode.XY: ATTR_XY_COLOR,
+}
+
+# States a light can be restored to, unavailable or unknown lights are left out
+RESTORABLE_STATES = frozenset({STATE_ON, STATE_OFF})
+
+# Color modes that are compared by their distance in the xy color space
+XY_CONVERSIONS = {
+    ColorMode.XY: lambda xy: xy,
+    ColorMode.HS: lambda hs: color_util.color_hs_to_xy(*hs),
+    ColorMode.RGB: lambda rgb: color_util.color_RGB_to_xy(*rgb),
+}
+
+
+class RestoreTolerances(NamedTuple):
+    """Differences within which a light already matches its snapshot."""
+
+    brightness: int
+    color_temp_kelvin: int
+    xy: float
+
+
+class VerificationPass(NamedTuple):
+    """Result of checking whether the lights of a restored scene reached it."""
+
+    scene: str
+    attempt: int
+    lights: int
+    stragglers: tuple[str, ...]
+
+
+class SceneSummary(NamedTuple):
+    """Small description of a scene snapshot, for state attributes."""
+
+    light_count: int
+    digest: str
+    saved_at: datetime | None
+
+
+def summarize_scene_states(
+    states: Mapping[str, Mapping[str, Any]], saved_at: datetime | None
+) -> SceneSummary:
+    """Count the lights of a scene snapshot and hash its content."""
+    content = json.dumps(states, sort_keys=True, separators=(",", ":"))
+    return SceneSummary(
+        len(states),
+        hashlib.blake2s(content.encode(), digest_size=6).hexdigest(),
+        saved_at,
+    )
+
+
+def compact_light_state(data: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Reduce a light state dict to what's needed to reproduce it.
+
+    Accepts both compact snapshots and full attribute dumps saved by older
+    versions, so it can be used to migrate restored scene states.
+    """
+    state = data.get(ATTR_STATE)
+    if state != STATE_ON:
+        return {ATTR_STATE: state}
+
+    compact: dict[str, Any] = {ATTR_STATE: state}
+    if (brightness := data.get(ATTR_BRIGHTNESS)) is not None:
+        compact[ATTR_BRIGHTNESS] = brightness
+
+    color_mode = data.get(ATTR_COLOR_MODE)
+    if color_mode is None:
+        return compact
+    compact[ATTR_COLOR_MODE] = color_mode
+
+    color_attr = COLOR_MODE_ATTRIBUTES.get(color_mode)
+    if color_attr and (color := data.get(color_attr)) is not None:
+        compact[color_attr] = list(color) if isinstance(color, tuple) else color
+    return compact
+
+
+def encode_light_state(state: State) -> dict[str, Any]:
+    """Encode a light's current state as a compact snapshot."""
+    return compact_light_state({ATTR_STATE: state.state, **state.attributes})
+
+
+def encode_scene_states(states: Mapping[str, Mapping[str, Any]]) -> dict[str, Any]:
+    """Compact every light in a scene snapshot that can be restored."""
+    return {
+        entity_id: compact_light_state(data)
+        for entity_id, data in states.items()
+        if data.get(ATTR_STATE) in RESTORABLE_STATES
+    }
+
+
+def light_service_call(target: Mapping[str, Any]) -> tuple[str, dict[str, Any]]:
+    """Decode a light snapshot into the light service and data that reproduce it."""
+    if target.get(ATTR_STATE) != STATE_ON:
+        return SERVICE_TURN_OFF, {}
+
+    data: dict[str, Any] = {}
+    brightness = target.get(ATTR_BRIGHTNESS)
+    color_mode = target.get(ATTR_COLOR_MODE)
+    if color_mode == ColorMode.WHITE and brightness is not None:
+        return SERVICE_TURN_ON, {ATTR_WHITE: brightness}
+    if brightness is not None:
+        data[ATTR_BRIGHTNESS] = brightness
+
+    color_attr = COLOR_MODE_ATTRIBUTES.get(color_mode)
+    if color_attr and (color := target.get(color_attr)) is not None:
+        data[color_attr] = tuple(color) if isinstance(color, list) else color
+    return SERVICE_TURN_ON, data
+
+
+def light_call_target(service: str, data: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Return the snapshot a light reaches once a service call takes effect.
+
+    Colors are left out, as lights may report them in another color mode.
+    """
+    if service != SERVICE_TURN_ON:
+        return {ATTR_STATE: STATE_OFF}
+    target: dict[str, Any] = {ATTR_STATE: STATE_ON}
+    brightness = data.get(ATTR_BRIGHTNESS, data.get(ATTR_WHITE))
+    if brightness is not None:
+        target[ATTR_BRIGHTNESS] = brightness
+    return target
+
+
+class LightCall(NamedTuple):
+    """A decoded light service call, hashable so equal targets can be grouped."""
+
+    service: str
+    data: tuple[tuple[str, Any], ...]
+
+
+def decode_scene_calls(
+    snapshot: Mapping[str, Mapping[str, Any]],
+) -> dict[str, LightCall]:
+    """Decode every light in a snapshot once, ready to be grouped on activation."""
+    calls = {}
+    for entity_id, target in snapshot.items():
+        service, data = light_service_call(target)
+        calls[entity_id] = LightCall(service, tuple(sorted(data.items())))
+    return calls
+
+
+def group_light_calls(
+    calls: Mapping[str, LightCall],
+    call_order: str = CALL_ORDER_LARGEST_FIRST,
+) -> list[tuple[str, dict[str, Any]]]:
+    """
+    Group lights with identical calls into multi-entity light service calls.
+
+    Calls are ordered by the first light of each group in snapshot order, or
+    with the largest groups first, keeping snapshot order between equal sizes.
+    """
+    groups: dict[LightCall, list[str]] = {}
+    for entity_id, call in calls.items():
+        groups.setdefault(call, []).append(entity_id)
+
+    grouped = [
+        (call.service, {**dict(call.data), ATTR_ENTITY_ID: entity_ids})
+        for call, entity_ids in groups.items()
+    ]
+    if call_order == CALL_ORDER_LARGEST_FIRST:
+        grouped.sort(key=lambda call: -len(call[1][ATTR_ENTITY_ID]))
+    return grouped
+
+
+def light_state_differs(
+    target: Mapping[str, Any],
+    state: State | None,
+    tolerances: RestoreTolerances,
+) -> bool:
+    """Return whether a light needs to be commanded to reach its snapshot."""
+    if state is None or state.state != target.get(ATTR_STATE):
+        return True
+    if state.state != STATE_ON:
+        return False
+
+    attributes = state.attributes
+    if (brightness := target.get(ATTR_BRIGHTNESS)) is not None:
+        current = attributes.get(ATTR_BRIGHTNESS)
+        if current is None or abs(current - brightness) > tolerances.brightness:
+            return True
+
+    color_mode = target.get(ATTR_COLOR_MODE)
+    color_attr = COLOR_MODE_ATTRIBUTES.get(color_mode)
+    if color_attr is None or (color := target.get(color_attr)) is None:
+        return False
+    if attributes.get(ATTR_COLOR_MODE) != color_mode:
+        return True
+    if (current := attributes.get(color_attr)) is None:
+        return True
+
+    if color_mode == ColorMode.COLOR_TEMP:
+        return abs(current - color) > tolerances.color_temp_kelvin
+    if to_xy := XY_CONVERSIONS.get(color_mode):
+        return math.dist(to_xy(current), to_xy(color)) > tolerances.xy
+    return list(current) != list(color)
+
+
+def diff_scene_states(
+    hass: HomeAssistant,
+    snapshot: Mapping[str, Mapping[str, Any]],
+    tolerances: RestoreTolerances,
+) -> tuple[dict[str, Mapping[str, Any]], int]:
+    """Split a snapshot into the lights that differ and a count of skipped lights."""
+    changed = {
+        entity_id: target
+        for entity_id, target in snapshot.items()
+        if light_state_differs(target, hass.states.get(entity_id), tolerances)
+    }
+    return changed, len(snapshot) - len(changed)
@@ -0,0 +1,49 @@
+"""Persistent storage for Zone Lighting zones."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10
+
+
+class ZoneStore:
+    """Versioned record of a zone's on state, selections and scene snapshots."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self._data_func: Callable[[], dict[str, Any]] | None = None
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Load the saved record, None if the zone was never stored."""
+        return await self._store.async_load()
+
+    @callback
+    def async_schedule_save(self, data_func: Callable[[], dict[str, Any]]) -> None:
+        """Save after a delay, coalescing changes made in the meantime."""
+        self._data_func = data_func
+        self._store.async_delay_save(data_func, STORAGE_SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Write a pending delayed save immediately."""
+        if self._data_func is None:
+            return
+        data_func, self._data_func = self._data_func, None
+        await self._store.async_save(data_func())
+
+    async def async_remove(self) -> None:
+        self._data_func = None
+        await self._store.async_remove()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 from copy import deepcopy
+from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
@@ -9,20 +10,33 @@ from homeassistant.config_entries import SOURCE_IMPORT
 from homeassistant.const import (
     ATTR_ENTITY_ID,
 )
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers import entity_registry as er
+from homeassistant.core import HomeAssistant, callback
 
 from .const import (
+    CONF_BRIGHTNESS_TOLERANCE,
+    CONF_CALL_ORDER,
+    CONF_COLOR_TEMP_TOLERANCE,
+    CONF_COMMAND_RATE,
+    CONF_COMMAND_TIMEOUT,
     CONF_CONTROLLERS,
+    CONF_LIGHTS,
+    CONF_NAME,
     CONF_SCENES,
     CONF_SCENES_EVENT,
+    CONF_VERIFY_RETRIES,
+    CONF_VERIFY_WINDOW,
+    CONF_XY_TOLERANCE,
+    CONF_ZONE_CONCURRENCY,
+    CONF_ZONES,
     COORDINATOR,
     DOMAIN,
     MANUAL,
     OPTIONS_LIST,
     SELECT_CONTROLLER,
     SELECT_SCENE,
+    ZONE_CONFIGS,
 )
+from .snapshot import RestoreTolerances
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -31,6 +45,8 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+OPTION_DEFAULTS = {entry["name"]: entry["default"] for entry in OPTIONS_LIST}
+
 
 def parse_config(
     config_entry: ConfigEntry | None,
@@ -39,12 +55,7 @@ def parse_config(
 ) -> dict[str, Any]:
     """Get the options and data from the config_entry and add defaults."""
     if defaults is None:
-        data = {
-            key: default
-            for key, default in map(
-                lambda entry: (entry["name"], entry["default"]), OPTIONS_LIST
-            )
-        }
+        data = dict(OPTION_DEFAULTS)
     else:
         data = deepcopy(defaults)
 
@@ -67,7 +78,7 @@ def parse_config(
 async def initialize_with_config(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
-) -> dict[str, Any] | None:
+) -> ZoneConfig | None:
     """Initialize Zone Lighting config entry."""
     data = hass.data[DOMAIN]
     assert config_entry.entry_id in data
@@ -88,7 +99,25 @@ async def initialize_with_config(
         await hass.config_entries.async_remove(config_entry.entry_id)
         return None
 
-    return parse_config(config_entry)
+    return async_get_zone_config(hass, config_entry)
+
+
+@callback
+def async_get_zone_config(hass: HomeAssistant, config_entry: ConfigEntry) -> ZoneConfig:
+    """Return an entry's compiled config, compiling it again only once it changed."""
+    configs = hass.data.setdefault(DOMAIN, {}).setdefault(ZONE_CONFIGS, {})
+    cached = configs.get(config_entry.entry_id)
+    # Entries replace their data and options mappings when they are updated
+    if (
+        cached is not None
+        and cached[0] is config_entry.data
+        and cached[1] is config_entry.options
+    ):
+        return cached[2]
+
+    config = ZoneConfig.from_data(parse_config(config_entry))
+    configs[config_entry.entry_id] = (config_entry.data, config_entry.options, config)
+    return config
 
 
 def get_coordinator(
@@ -105,11 +134,6 @@ class ListType(Enum):
     CONTROLLER = 1
 
 
-conf_mapping = {
-    ListType.CONTROLLER: [CONF_CONTROLLERS],
-    ListType.SCENE: [CONF_SCENES, CONF_SCENES_EVENT],
-}
-
 select_mapping = {
     ListType.CONTROLLER: SELECT_CONTROLLER,
     ListType.SCENE: SELECT_SCENE,
@@ -120,20 +144,77 @@ def filter_conf_list(values: list[str]):
     return list(filter(lambda value: bool(value), values))
 
 
-def get_conf_list_plain(data: dict[str, Any], key: str):
-    return filter_conf_list(data[key])
-
-
-def get_conf_list(data: dict[str, Any], type: ListType):
-    all_items = [MANUAL]
-    for param in conf_mapping[type]:
-        if data[param]:
-            all_items += get_conf_list_plain(data, param)
-    return all_items
+@dataclass(frozen=True, slots=True)
+class ZoneConfig:
+    """
+    A zone's options, compiled once per config entry.
+
+    Lists are filtered into tuples, with frozensets for membership checks.
+    """
+
+    name: str
+    lights: tuple[str, ...]
+    zones: tuple[str, ...]
+    simple_scenes: tuple[str, ...]
+    event_scenes: tuple[str, ...]
+    controllers: tuple[str, ...]
+    scene_options: tuple[str, ...]
+    controller_options: tuple[str, ...]
+    simple_scene_set: frozenset[str]
+    event_scene_set: frozenset[str]
+    member_set: frozenset[str]
+    restore_tolerances: RestoreTolerances
+    call_order: str
+    command_rate: float
+    command_timeout: float
+    zone_concurrency: int
+    verify_window: float
+    verify_retries: int
+    _option_sets: tuple[frozenset[str], frozenset[str]]
+
+    @classmethod
+    def from_data(cls, data: dict[str, Any]) -> ZoneConfig:
+        """Compile parsed config data."""
+        simple_scenes = tuple(filter_conf_list(data[CONF_SCENES]))
+        event_scenes = tuple(filter_conf_list(data[CONF_SCENES_EVENT]))
+        controllers = tuple(filter_conf_list(data[CONF_CONTROLLERS]))
+        scene_options = (MANUAL, *simple_scenes, *event_scenes)
+        controller_options = (MANUAL, *controllers)
+        return cls(
+            name=data[CONF_NAME],
+            lights=tuple(data[CONF_LIGHTS]),
+            zones=tuple(data[CONF_ZONES]),
+            simple_scenes=simple_scenes,
+            event_scenes=event_scenes,
+            controllers=controllers,
+            scene_options=scene_options,
+            controller_options=controller_options,
+            simple_scene_set=frozenset(simple_scenes),
+            event_scene_set=frozenset(event_scenes),
+            member_set=frozenset((*data[CONF_LIGHTS], *data[CONF_ZONES])),
+            restore_tolerances=RestoreTolerances(
+                brightness=data[CONF_BRIGHTNESS_TOLERANCE],
+                color_temp_kelvin=data[CONF_COLOR_TEMP_TOLERANCE],
+                xy=data[CONF_XY_TOLERANCE],
+            ),
+            call_order=data[CONF_CALL_ORDER],
+            command_rate=data[CONF_COMMAND_RATE],
+            command_timeout=data[CONF_COMMAND_TIMEOUT],
+            zone_concurrency=data[CONF_ZONE_CONCURRENCY],
+            verify_window=data[CONF_VERIFY_WINDOW],
+            verify_retries=data[CONF_VERIFY_RETRIES],
+            _option_sets=(frozenset(scene_options), frozenset(controller_options)),
+        )
 
+    def options(self, type: ListType) -> tuple[str, ...]:
+        """Return the selectable values of a list, Manual first."""
+        if type is ListType.SCENE:
+            return self.scene_options
+        return self.controller_options
 
-def validate_list_option(data: dict[str, Any], type: ListType, option: str):
-    return option in get_conf_list(data, type)
+    def is_option(self, type: ListType, option: str) -> bool:
+        """Return whether a value can be selected in a list."""
+        return option in self._option_sets[type.value]
 
 
 def get_select_for_list(hass: HomeAssistant, entry_id: str, type: ListType):
@@ -146,10 +227,3 @@ def get_current_list_option(hass: HomeAssistant, entry_id: str, type: ListType):
 
 def get_scene_unique_id(entry_id: str, scene: str):
     return f"{entry_id}_scene_{scene}"
-
-
-def async_get_scene_entity_id(hass: HomeAssistant, entry_id: str, scene: str):
-    registry = er.async_get(hass)
-    return registry.async_get_entity_id(
-        "scene", DOMAIN, get_scene_unique_id(entry_id, scene)
-    )
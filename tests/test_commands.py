@@ -0,0 +1,132 @@
+"""Tests for Zone Lighting light command queueing."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+from homeassistant.const import ATTR_ENTITY_ID
+
+from custom_components.zone_lighting.commands import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    CoalescingCommandQueue,
+    CommandScheduler,
+)
+
+
+def fake_hass(sent: list[tuple[float, str, list[str]]]) -> SimpleNamespace:
+    """Build the parts of Home Assistant the queues use, recording light calls."""
+    loop = asyncio.get_running_loop()
+
+    async def async_call(domain, service, data, blocking, context):  # noqa: ARG001
+        sent.append((time.monotonic(), service, data[ATTR_ENTITY_ID]))
+
+    return SimpleNamespace(
+        loop=loop,
+        async_create_task=lambda target, name: loop.create_task(target),  # noqa: ARG005
+        async_create_background_task=lambda target, name: loop.create_task(target),  # noqa: ARG005
+        services=SimpleNamespace(async_call=async_call),
+    )
+
+
+def lights(count: int, zone: str = "zone") -> list[str]:
+    return [f"light.{zone}_{index}" for index in range(count)]
+
+
+def test_scheduler_rate_is_shared_by_zones() -> None:
+    """Zones together send no more lights per second than the scheduler's rate."""
+
+    async def run() -> list[tuple[float, str, list[str]]]:
+        sent = []
+        scheduler = CommandScheduler(fake_hass(sent))
+        zones = [f"zone_{index}" for index in range(4)]
+        for zone in zones:
+            scheduler.async_set_zone(zone, 10)
+        await asyncio.gather(
+            *(
+                scheduler.async_call(zone, "turn_on", {ATTR_ENTITY_ID: [entity_id]})
+                for zone in zones
+                for entity_id in lights(10, zone)
+            )
+        )
+        return sent
+
+    sent = asyncio.run(run())
+    # A full bucket covers the first 20 lights, the other 20 take a second
+    assert len(sent) == 40
+    assert sent[-1][0] - sent[0][0] >= 0.9
+
+
+def test_scheduler_charges_large_calls_in_full() -> None:
+    """A call larger than the bucket delays the calls after it by its debt."""
+
+    async def run() -> list[tuple[float, str, list[str]]]:
+        sent = []
+        scheduler = CommandScheduler(fake_hass(sent))
+        scheduler._async_apply_rate(100)
+        await scheduler.async_call("zone", "turn_on", {ATTR_ENTITY_ID: lights(150)})
+        await scheduler.async_call("zone", "turn_on", {ATTR_ENTITY_ID: lights(1)})
+        return sent
+
+    (large, _, _), (small, _, _) = asyncio.run(run())
+    # 150 lights leave the bucket 50 in debt, one more light waits 0.51s
+    assert small - large >= 0.45
+
+
+def test_scheduler_priority_spans_zones() -> None:
+    """An interactive call from one zone overtakes a restore from another."""
+
+    async def run() -> list[tuple[float, str, list[str]]]:
+        sent = []
+        scheduler = CommandScheduler(fake_hass(sent))
+        # Empty the bucket so the next calls have to wait for tokens
+        await scheduler.async_call(
+            "busy", "turn_on", {ATTR_ENTITY_ID: lights(int(scheduler.burst))}
+        )
+        await asyncio.gather(
+            scheduler.async_call(
+                "restoring",
+                "turn_on",
+                {ATTR_ENTITY_ID: lights(1, "restoring")},
+                priority=PRIORITY_BACKGROUND,
+            ),
+            scheduler.async_call(
+                "interactive",
+                "turn_off",
+                {ATTR_ENTITY_ID: lights(1, "interactive")},
+                priority=PRIORITY_INTERACTIVE,
+            ),
+        )
+        return sent
+
+    services = [service for _, service, _ in asyncio.run(run())]
+    assert services == ["turn_on", "turn_off", "turn_on"]
+
+
+def test_command_after_discard_is_sent() -> None:
+    """A command queued right after a discard isn't lost with the old runner."""
+
+    async def run() -> list[dict]:
+        sent = []
+        started = asyncio.Event()
+
+        async def send(data: dict) -> None:
+            sent.append(data)
+            if len(sent) == 1:
+                # Still in flight when it's discarded
+                started.set()
+                await asyncio.Event().wait()
+
+        queue = CoalescingCommandQueue(fake_hass([]), "zone", send, 0)
+        first = asyncio.create_task(queue.async_send({"brightness": 100}))
+        await started.wait()
+        queue.async_discard()
+        # Queued in the same step, before the discarded runner has stopped
+        async with asyncio.timeout(1):
+            await queue.async_send({"brightness": 200})
+        await first
+        return sent
+
+    assert asyncio.run(run()) == [{"brightness": 100}, {"brightness": 200}]
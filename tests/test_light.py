@@ -0,0 +1,180 @@
+"""Tests for the Zone Lighting light platform."""
+
+from __future__ import annotations
+
+import random
+import time
+from types import SimpleNamespace
+
+import pytest
+from homeassistant.components.group.light import LightGroup
+from homeassistant.components.light import (
+    ATTR_BRIGHTNESS,
+    ATTR_COLOR_MODE,
+    ATTR_COLOR_TEMP_KELVIN,
+    ATTR_HS_COLOR,
+    ATTR_MAX_COLOR_TEMP_KELVIN,
+    ATTR_MIN_COLOR_TEMP_KELVIN,
+    ATTR_RGB_COLOR,
+    ATTR_RGBW_COLOR,
+    ATTR_RGBWW_COLOR,
+    ATTR_SUPPORTED_COLOR_MODES,
+    ATTR_XY_COLOR,
+    ColorMode,
+    LightEntityFeature,
+)
+from homeassistant.const import (
+    ATTR_SUPPORTED_FEATURES,
+    STATE_OFF,
+    STATE_ON,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+)
+from homeassistant.core import State
+
+from custom_components.zone_lighting.light import GroupStateAggregator
+
+MEMBERS = [f"light.member_{index}" for index in range(6)]
+
+COLOR_MODES = [
+    ColorMode.ONOFF,
+    ColorMode.BRIGHTNESS,
+    ColorMode.COLOR_TEMP,
+    ColorMode.HS,
+    ColorMode.XY,
+    ColorMode.RGB,
+    ColorMode.RGBW,
+    ColorMode.RGBWW,
+    ColorMode.WHITE,
+]
+
+FEATURES = [
+    LightEntityFeature(0),
+    LightEntityFeature.TRANSITION,
+    LightEntityFeature.FLASH | LightEntityFeature.TRANSITION,
+    LightEntityFeature.EFFECT,
+]
+
+# Means of float tuples are exact in the aggregator and summed in order by the
+# group, so they may differ in the last bits
+FLOAT_ATTRIBUTES = (ATTR_HS_COLOR, ATTR_XY_COLOR)
+
+
+def random_state(rng: random.Random, entity_id: str) -> State | None:
+    """Build a random member light state, None for a removed light."""
+    state = rng.choice(
+        [STATE_ON, STATE_ON, STATE_OFF, STATE_UNAVAILABLE, STATE_UNKNOWN, None]
+    )
+    if state is None:
+        return None
+
+    supported = rng.sample(COLOR_MODES, rng.randint(1, 3))
+    if ColorMode.WHITE in supported and ColorMode.HS not in supported:
+        # White is only valid next to a color mode
+        supported.append(ColorMode.HS)
+    attributes = {
+        ATTR_SUPPORTED_COLOR_MODES: [str(mode) for mode in supported],
+        ATTR_SUPPORTED_FEATURES: rng.choice(FEATURES),
+        ATTR_MIN_COLOR_TEMP_KELVIN: rng.choice([None, 2000, 2200, 2700]),
+        ATTR_MAX_COLOR_TEMP_KELVIN: rng.choice([None, 5000, 6500]),
+    }
+    if state == STATE_ON:
+        attributes[ATTR_COLOR_MODE] = str(rng.choice(supported))
+        candidates = {
+            ATTR_BRIGHTNESS: lambda: rng.randint(1, 255),
+            ATTR_COLOR_TEMP_KELVIN: lambda: rng.randint(2000, 6500),
+            ATTR_HS_COLOR: lambda: (rng.uniform(0, 360), rng.uniform(0, 100)),
+            ATTR_XY_COLOR: lambda: (rng.random(), rng.random()),
+            ATTR_RGB_COLOR: lambda: tuple(rng.randint(0, 255) for _ in range(3)),
+            ATTR_RGBW_COLOR: lambda: tuple(rng.randint(0, 255) for _ in range(4)),
+            ATTR_RGBWW_COLOR: lambda: tuple(rng.randint(0, 255) for _ in range(5)),
+        }
+        for attr, value in candidates.items():
+            if rng.random() < 0.7:
+                attributes[attr] = value()
+    attributes = {key: value for key, value in attributes.items() if value is not None}
+    return State(entity_id, state, attributes)
+
+
+def assert_same_group_state(group: LightGroup, members: GroupStateAggregator) -> None:
+    """Compare the incremental state to the group's full recalculation."""
+    assert members.is_on == group.is_on
+    assert members.available == group.available
+    assert members.brightness == group.brightness
+    assert members.color_temp_kelvin == group.color_temp_kelvin
+    assert members.min_color_temp_kelvin == group.min_color_temp_kelvin
+    assert members.max_color_temp_kelvin == group.max_color_temp_kelvin
+    for attr in (ATTR_RGB_COLOR, ATTR_RGBW_COLOR, ATTR_RGBWW_COLOR):
+        assert members.color(attr) == getattr(group, attr)
+    for attr in FLOAT_ATTRIBUTES:
+        expected = getattr(group, attr)
+        if expected is None:
+            assert members.color(attr) is None
+        else:
+            assert members.color(attr) == pytest.approx(expected)
+
+    supported_color_modes = members.supported_color_modes
+    assert supported_color_modes == group.supported_color_modes
+    assert members.color_mode(supported_color_modes) == group.color_mode
+    assert members.supported_features == group.supported_features
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_aggregator_matches_light_group(seed: int) -> None:
+    """Random member changes give the same state as LightGroup."""
+    rng = random.Random(seed)
+    states: dict[str, State] = {}
+
+    group = LightGroup(None, "Reference", MEMBERS, None)
+    group.hass = SimpleNamespace(states=SimpleNamespace(get=states.get))
+    members = GroupStateAggregator()
+    members.set_order(MEMBERS)
+
+    for _ in range(200):
+        entity_id = rng.choice(MEMBERS)
+        if (state := random_state(rng, entity_id)) is None:
+            states.pop(entity_id, None)
+        else:
+            states[entity_id] = state
+        members.update(entity_id, state)
+
+        group.async_update_group_state()
+        assert_same_group_state(group, members)
+
+
+def time_per_event(size: int, events: int = 2000) -> float:
+    """Return the seconds an aggregator with this many members takes per event."""
+    rng = random.Random(size)
+    entity_ids = [f"light.member_{index}" for index in range(size)]
+    members = GroupStateAggregator()
+    members.set_order(entity_ids)
+    for entity_id in entity_ids:
+        members.update(entity_id, random_state(rng, entity_id))
+    changes = [
+        (entity_id, random_state(rng, entity_id))
+        for entity_id in rng.choices(entity_ids, k=events)
+    ]
+
+    start = time.perf_counter()
+    for entity_id, state in changes:
+        members.update(entity_id, state)
+        supported_color_modes = members.supported_color_modes
+        members.color_mode(supported_color_modes)
+        members.is_on  # noqa: B018
+        members.available  # noqa: B018
+        members.brightness  # noqa: B018
+        members.color_temp_kelvin  # noqa: B018
+        members.min_color_temp_kelvin  # noqa: B018
+        members.max_color_temp_kelvin  # noqa: B018
+        members.supported_features  # noqa: B018
+        for attr in (ATTR_RGB_COLOR, *FLOAT_ATTRIBUTES):
+            members.color(attr)
+    return (time.perf_counter() - start) / events
+
+
+def test_aggregator_event_cost_does_not_grow_with_members() -> None:
+    """A member change costs about the same with 100 or 10,000 members."""
+    small = min(time_per_event(100) for _ in range(3))
+    large = min(time_per_event(10_000) for _ in range(3))
+    # Work proportional to the members would make this about 100
+    assert large < 5 * small